@@ -1,9 +1,10 @@
 from django.contrib import admin
+from scholarship_portal.admin_mixins import ListDisplayOnlyMixin
 from .models import CustomUser, UserProfile
 
 
 @admin.register(CustomUser)
-class CustomUserAdmin(admin.ModelAdmin):
+class CustomUserAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('username', 'email', 'first_name', 'last_name', 'user_type', 'is_verified', 'is_active')
     list_filter = ('user_type', 'is_verified', 'is_active', 'created_at')
     search_fields = ('username', 'email', 'first_name', 'last_name')
@@ -20,5 +21,6 @@ class CustomUserAdmin(admin.ModelAdmin):
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'city', 'state', 'postal_code')
+    list_select_related = ('user',)
     search_fields = ('user__username', 'user__email', 'city', 'state')
     list_filter = ('city', 'state')
@@ -0,0 +1,36 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import check_password, make_password
+from django.db.models import Q
+from django.utils.crypto import get_random_string
+
+from .models import CustomUser
+
+
+# Hashed once at import so a missing user costs the same hashing work as a
+# wrong password, keeping response time independent of account existence
+# (a real hash: check_password() returns at once for make_password(None))
+DUMMY_HASH = make_password(get_random_string(32))
+
+
+class EmailOrUsernameBackend(ModelBackend):
+    """Authenticate against either the username or the email in one query"""
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(CustomUser.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        
+        # The full row is loaded: login goes on to touch last_login, is_staff,
+        # is_superuser and the profile fields, each a lazy query if deferred
+        user = CustomUser.objects.filter(
+            Q(username=username) | Q(email=username)
+        ).first()
+        
+        if user is None:
+            check_password(password, DUMMY_HASH)
+            return None
+        
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
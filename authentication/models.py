@@ -14,6 +14,7 @@ class CustomUser(AbstractUser):
         ('super_admin', 'Super Admin'),
     )
     
+    email = models.EmailField(unique=True)
     user_type = models.CharField(max_length=20, choices=USER_TYPES, default='student')
     phone_number = models.CharField(max_length=15, blank=True, null=True)
     profile_picture = models.ImageField(upload_to='profile_pictures/', blank=True, null=True)
@@ -26,6 +27,9 @@ class CustomUser(AbstractUser):
     
     class Meta:
         db_table = 'auth_users'
+        indexes = [
+            models.Index(fields=['user_type']),
+        ]
 
 
 class UserProfile(models.Model):
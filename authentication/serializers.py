@@ -1,8 +1,53 @@
+import hmac
+import re
+from copy import copy, deepcopy
+
 from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
-from django.core.validators import RegexValidator
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as BaseTokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from .models import CustomUser, UserProfile
+from .tokens import CacheBlacklistRefreshToken, PASSWORD_RESET_KEY, hash_reset_token
+
+
+# Precomputed user_type -> label map, avoids the per-object choices walk
+USER_TYPE_DISPLAY = dict(CustomUser.USER_TYPES)
+
+# Compiled once at import; matched against the whole value
+_PHONE_RE = re.compile(r'\+?1?\d{9,15}')
+# Letters, digits, '_' and '.', with at least one letter or digit
+_USERNAME_RE = re.compile(r'(?=.*[^\W_])[\w.]+')
+
+
+def _validate_phone(value):
+    """Validate phone number format"""
+    if not _PHONE_RE.fullmatch(value):
+        raise serializers.ValidationError("Phone number must be valid format")
+
+
+# Per-class cache of the field instances built by ModelSerializer.get_fields()
+_FIELDS_CACHE = {}
+
+
+def _copy_field(field):
+    """Shallow-copy plain fields; nested serializers and list fields bind their children, so deep-copy those"""
+    if isinstance(field, (serializers.BaseSerializer, serializers.ListField)):
+        return deepcopy(field)
+    return copy(field)
+
+
+class CachedFieldsMixin:
+    """Build the serializer fields once per class and hand out copies"""
+    
+    def get_fields(self):
+        cls = type(self)
+        if cls not in _FIELDS_CACHE:
+            _FIELDS_CACHE[cls] = super().get_fields()
+        return {name: _copy_field(field) for name, field in _FIELDS_CACHE[cls].items()}
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -20,10 +65,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     )
     phone_number = serializers.CharField(
         required=False,
-        validators=[RegexValidator(
-            regex=r'^\+?1?\d{9,15}$',
-            message="Phone number must be valid format"
-        )]
+        validators=[_validate_phone]
     )
     
     class Meta:
@@ -33,20 +75,15 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'password', 'password_confirm', 'user_type', 'phone_number'
         )
         extra_kwargs = {
-            'email': {'required': True},
+            # Uniqueness is enforced by the database constraint in create()
+            'email': {'required': True, 'validators': []},
             'first_name': {'required': True},
             'last_name': {'required': True},
         }
-        
-    def validate_email(self, value):
-        """Validate email uniqueness"""
-        if CustomUser.objects.filter(email=value).exists():
-            raise serializers.ValidationError("Email already exists")
-        return value
     
     def validate_username(self, value):
         """Validate username format"""
-        if not value.replace('_', '').replace('.', '').isalnum():
+        if not _USERNAME_RE.fullmatch(value):
             raise serializers.ValidationError(
                 "Username can only contain letters, numbers, underscores and dots"
             )
@@ -60,12 +97,18 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         validated_data.pop('password_confirm')
         password = validated_data.pop('password')
-        user = CustomUser.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
-        
-        # Create user profile
-        UserProfile.objects.create(user=user)
+        try:
+            # create_user hashes the password and saves in a single INSERT; the
+            # post_save signal adds the profile inside the same transaction
+            with transaction.atomic():
+                user = CustomUser.objects.create_user(password=password, **validated_data)
+        except IntegrityError:
+            # A concurrent signup took the username or email; report whichever it was
+            if CustomUser.objects.filter(username=validated_data.get('username')).exists():
+                raise serializers.ValidationError({'username': 'Username already exists'})
+            if CustomUser.objects.filter(email=validated_data.get('email')).exists():
+                raise serializers.ValidationError({'email': 'Email already exists'})
+            raise
         
         return user
 
@@ -86,17 +129,13 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
         
         if username and password:
-            # Allow login with email or username
-            user = None
-            if '@' in username:
-                try:
-                    user_obj = CustomUser.objects.get(email=username)
-                    user = authenticate(username=user_obj.username, password=password)
-                except CustomUser.DoesNotExist:
-                    pass
-            else:
-                user = authenticate(username=username, password=password)
-                
+            # EmailOrUsernameBackend accepts either the username or the email
+            user = authenticate(
+                request=self.context.get('request'),
+                username=username,
+                password=password
+            )
+            
             if not user:
                 raise serializers.ValidationError('Invalid credentials')
             if not user.is_active:
@@ -108,27 +147,36 @@ class UserLoginSerializer(serializers.Serializer):
             raise serializers.ValidationError('Must include username and password')
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Enhanced serializer for user profile with nested data"""
     
     full_name = serializers.SerializerMethodField()
-    user_type_display = serializers.CharField(source='get_user_type_display', read_only=True)
+    user_type_display = serializers.SerializerMethodField()
     
     class Meta:
         model = UserProfile
-        fields = '__all__'
+        fields = (
+            'id', 'user', 'full_name', 'user_type_display', 'date_of_birth',
+            'address', 'city', 'state', 'postal_code',
+            'emergency_contact_name', 'emergency_contact_phone'
+        )
         read_only_fields = ('user',)
     
     def get_full_name(self, obj):
-        return obj.user.get_full_name()
+        user = obj.user
+        return f"{user.first_name} {user.last_name}".strip()
+    
+    def get_user_type_display(self, obj):
+        user_type = obj.user.user_type
+        return USER_TYPE_DISPLAY.get(user_type, user_type)
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Enhanced serializer for user information with profile data"""
     
     profile = UserProfileSerializer(read_only=True)
     full_name = serializers.SerializerMethodField()
-    user_type_display = serializers.CharField(source='get_user_type_display', read_only=True)
+    user_type_display = serializers.SerializerMethodField()
     
     class Meta:
         model = CustomUser
@@ -140,7 +188,10 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'is_verified', 'user_type')
     
     def get_full_name(self, obj):
-        return obj.get_full_name()
+        return f"{obj.first_name} {obj.last_name}".strip()
+    
+    def get_user_type_display(self, obj):
+        return USER_TYPE_DISPLAY.get(obj.user_type, obj.user_type)
 
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -160,6 +211,14 @@ class ChangePasswordSerializer(serializers.Serializer):
         required=True,
         style={'input_type': 'password'}
     )
+    old_refresh_token = serializers.CharField(
+        required=False,
+        help_text=(
+            "The session's current refresh token, blacklisted on success. Changing the "
+            "password does not revoke existing refresh tokens by itself; send this to "
+            "end the current session's token."
+        )
+    )
     
     def validate_old_password(self, value):
         user = self.context['request'].user
@@ -167,6 +226,17 @@ class ChangePasswordSerializer(serializers.Serializer):
             raise serializers.ValidationError("Old password is incorrect")
         return value
     
+    def validate_old_refresh_token(self, value):
+        try:
+            token = CacheBlacklistRefreshToken(value)
+        except TokenError:
+            raise serializers.ValidationError("Invalid refresh token")
+        # Only the requesting user's own token may be blacklisted here
+        user = self.context['request'].user
+        if str(token.get(jwt_settings.USER_ID_CLAIM)) != str(getattr(user, jwt_settings.USER_ID_FIELD)):
+            raise serializers.ValidationError("Invalid refresh token")
+        return token
+    
     def validate(self, attrs):
         if attrs['new_password'] != attrs['confirm_password']:
             raise serializers.ValidationError("New passwords don't match")
@@ -188,20 +258,18 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         profile_data = validated_data.pop('profile', None)
         
-        # Update user fields
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        # Update user fields, writing only the columns that were sent
+        if validated_data:
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save(update_fields=[*validated_data, 'updated_at'])
         
-        # Update profile fields
+        # Update profile fields (already validated by the nested serializer)
         if profile_data and hasattr(instance, 'profile'):
-            profile_serializer = UserProfileSerializer(
-                instance.profile, 
-                data=profile_data, 
-                partial=True
-            )
-            if profile_serializer.is_valid():
-                profile_serializer.save()
+            profile = instance.profile
+            for attr, value in profile_data.items():
+                setattr(profile, attr, value)
+            profile.save(update_fields=list(profile_data))
         
         return instance
 
@@ -222,6 +290,7 @@ class PasswordResetRequestSerializer(serializers.Serializer):
 class PasswordResetConfirmSerializer(serializers.Serializer):
     """Serializer for password reset confirmation"""
     
+    email = serializers.EmailField(required=True)
     token = serializers.CharField(required=True)
     new_password = serializers.CharField(
         required=True,
@@ -237,4 +306,20 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     def validate(self, attrs):
         if attrs['new_password'] != attrs['confirm_password']:
             raise serializers.ValidationError("Passwords don't match")
+        
+        user = CustomUser.objects.filter(email=attrs['email']).first()
+        stored = user and cache.get(PASSWORD_RESET_KEY.format(user_id=user.pk))
+        
+        # Compare digests in constant time so the token can't be probed byte by byte
+        supplied = hash_reset_token(attrs['token'])
+        if not stored or not hmac.compare_digest(stored.encode(), supplied.encode()):
+            raise serializers.ValidationError("Invalid or expired reset token")
+        
+        attrs['user'] = user
         return attrs
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """Token refresh that checks and rotates against the cache blacklist"""
+    
+    token_class = CacheBlacklistRefreshToken
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import CustomUser, UserProfile
+
+
+@receiver(post_save, sender=CustomUser)
+def create_user_profile(sender, instance, created, **kwargs):
+    """Create the profile row alongside every new user"""
+    if created:
+        UserProfile.objects.create(user=instance)
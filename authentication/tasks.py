@@ -0,0 +1,41 @@
+"""
+Background tasks for the authentication app
+"""
+
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+
+from .models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(autoretry_for=(Exception,), retry_kwargs={'max_retries': 3, 'countdown': 60})
+def send_welcome_email(user_id):
+    """Send the welcome email to a newly registered user"""
+    try:
+        user = CustomUser.objects.get(pk=user_id)
+    except CustomUser.DoesNotExist:
+        logger.warning(f"Skipping welcome email, user {user_id} no longer exists")
+        return
+    
+    send_mail(
+        'Welcome to Scholarship Portal',
+        f'Hello {user.get_full_name()}, welcome to the portal!',
+        settings.EMAIL_HOST_USER,
+        [user.email],
+    )
+
+
+@shared_task(autoretry_for=(Exception,), retry_kwargs={'max_retries': 3, 'countdown': 60})
+def send_reset_email(email, token):
+    """Send the password reset token to the given address"""
+    send_mail(
+        'Password Reset Request',
+        f'Use this token to reset your password: {token}',
+        settings.EMAIL_HOST_USER,
+        [email],
+    )
@@ -0,0 +1,40 @@
+from django.test import TestCase, override_settings
+
+from authentication.backends import EmailOrUsernameBackend
+from authentication.models import CustomUser
+
+
+@override_settings(AUTHENTICATION_BACKENDS=['authentication.backends.EmailOrUsernameBackend'])
+class EmailOrUsernameBackendTests(TestCase):
+    """Login by username or email, with one query and no deferred fields"""
+    
+    def setUp(self):
+        self.backend = EmailOrUsernameBackend()
+        self.user = CustomUser.objects.create_user(
+            username='asha', email='asha@example.com', password='s3cret-pass'
+        )
+    
+    def test_username(self):
+        self.assertEqual(self.backend.authenticate(None, username='asha', password='s3cret-pass'), self.user)
+    
+    def test_email(self):
+        self.assertEqual(
+            self.backend.authenticate(None, username='asha@example.com', password='s3cret-pass'), self.user
+        )
+    
+    def test_wrong_password(self):
+        self.assertIsNone(self.backend.authenticate(None, username='asha', password='wrong-pass'))
+    
+    def test_unknown_user(self):
+        self.assertIsNone(self.backend.authenticate(None, username='nobody', password='s3cret-pass'))
+    
+    def test_inactive_user(self):
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        self.assertIsNone(self.backend.authenticate(None, username='asha', password='s3cret-pass'))
+    
+    def test_single_query_without_lazy_loads(self):
+        with self.assertNumQueries(1):
+            user = self.backend.authenticate(None, username='asha@example.com', password='s3cret-pass')
+        with self.assertNumQueries(0):
+            user.is_staff, user.is_superuser, user.last_login, user.get_full_name()
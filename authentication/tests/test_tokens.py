@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.exceptions import TokenError
+
+from authentication.models import CustomUser
+from authentication.tokens import BLACKLIST_KEY, CacheBlacklistRefreshToken
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CacheBlacklistRefreshTokenTests(TestCase):
+    """Blacklisted refresh tokens are rejected until they would have expired anyway"""
+    
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            username='asha', email='asha@example.com', password='s3cret-pass'
+        )
+    
+    def test_fresh_token_verifies(self):
+        token = CacheBlacklistRefreshToken.for_user(self.user)
+        CacheBlacklistRefreshToken(str(token))
+    
+    def test_blacklisted_token_is_rejected(self):
+        token = CacheBlacklistRefreshToken.for_user(self.user)
+        token.blacklist()
+        with self.assertRaises(TokenError):
+            CacheBlacklistRefreshToken(str(token))
+    
+    def test_blacklist_only_affects_that_token(self):
+        first = CacheBlacklistRefreshToken.for_user(self.user)
+        second = CacheBlacklistRefreshToken.for_user(self.user)
+        first.blacklist()
+        CacheBlacklistRefreshToken(str(second))
+    
+    def test_entry_expires_with_the_token(self):
+        token = CacheBlacklistRefreshToken.for_user(self.user)
+        token.set_exp(lifetime=-token.lifetime)
+        token.blacklist()
+        self.assertIsNone(cache.get(BLACKLIST_KEY.format(jti=token['jti'])))
@@ -0,0 +1,41 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+BLACKLIST_KEY = 'jwt:bl:{jti}'
+PASSWORD_RESET_KEY = 'pwreset:{user_id}'
+PASSWORD_RESET_TIMEOUT = 60 * 60  # 1 hour
+
+
+def hash_reset_token(token):
+    """Digest stored in place of the raw password reset token"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class CacheBlacklistRefreshToken(RefreshToken):
+    """Refresh token whose blacklist lives in the cache instead of DB tables.
+    
+    Each blacklisted jti is stored with a TTL equal to the token's remaining
+    lifetime, so entries expire on their own once the token would be invalid.
+    """
+    
+    def verify(self, *args, **kwargs):
+        self.check_blacklist()
+        super().verify(*args, **kwargs)
+    
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if cache.get(BLACKLIST_KEY.format(jti=jti)):
+            raise TokenError(_('Token is blacklisted'))
+    
+    def blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        timeout = int(self.payload['exp'] - time.time())
+        if timeout > 0:
+            cache.set(BLACKLIST_KEY.format(jti=jti), 1, timeout=timeout)
@@ -1,15 +1,16 @@
 from rest_framework import status, viewsets, permissions
-from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.mixins import RetrieveModelMixin, UpdateModelMixin
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView as BaseTokenRefreshView
 from django.contrib.auth import authenticate
 from django.utils import timezone
-from django.core.mail import send_mail
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+import logging
 import uuid
 
 from .models import CustomUser, UserProfile
@@ -21,8 +22,27 @@ from .serializers import (
     ChangePasswordSerializer,
     UserUpdateSerializer,
     PasswordResetRequestSerializer,
-    PasswordResetConfirmSerializer
+    PasswordResetConfirmSerializer,
+    TokenRefreshSerializer
 )
+from .tokens import (
+    CacheBlacklistRefreshToken as RefreshToken,
+    PASSWORD_RESET_KEY,
+    PASSWORD_RESET_TIMEOUT,
+    hash_reset_token
+)
+from .tasks import send_welcome_email, send_reset_email
+
+
+logger = logging.getLogger(__name__)
+
+
+def _queue_welcome_email(user_id):
+    """Queue the welcome email; a broker failure must not fail the registration"""
+    try:
+        send_welcome_email.delay(user_id)
+    except Exception:
+        logger.exception("Failed to queue welcome email for user %s", user_id)
 
 
 class CustomPermissions:
@@ -56,16 +76,32 @@ class CustomPermissions:
             ]
 
 
+# Permission classes are stateless, so one instance per list is shared by every request
+_PUBLIC_ACTIONS = frozenset({
+    'register', 'login', 'password_reset_request', 'password_reset_confirm'
+})
+_ALLOW_ANY = [AllowAny()]
+_REQUIRES_AUTH = [IsAuthenticated()]
+
+
+class TokenRefreshView(BaseTokenRefreshView):
+    """JWT refresh endpoint backed by the cache token blacklist"""
+    
+    serializer_class = TokenRefreshSerializer
+
+
 class AuthenticationViewSet(GenericViewSet):
     """Enhanced authentication viewset with comprehensive auth features"""
     
     def get_permissions(self):
         """Set permissions based on action"""
-        if self.action in ['register', 'login', 'password_reset_request']:
-            permission_classes = [AllowAny]
-        else:
-            permission_classes = [IsAuthenticated]
-        return [permission() for permission in permission_classes]
+        if self.action in _PUBLIC_ACTIONS:
+            return _ALLOW_ANY
+        return _REQUIRES_AUTH
+    
+    def _load_user(self, pk):
+        """Fetch user with profile joined so UserSerializer doesn't lazy-load it"""
+        return CustomUser.objects.select_related('profile').get(pk=pk)
     
     @action(detail=False, methods=['post'])
     def register(self, request):
@@ -77,22 +113,13 @@ class AuthenticationViewSet(GenericViewSet):
             # Generate tokens
             refresh = RefreshToken.for_user(user)
             
-            # Send welcome email (optional)
+            # Send welcome email (optional) from the worker once the user is committed
             if hasattr(settings, 'EMAIL_HOST_USER'):
-                try:
-                    send_mail(
-                        'Welcome to Scholarship Portal',
-                        f'Hello {user.get_full_name()}, welcome to the portal!',
-                        settings.EMAIL_HOST_USER,
-                        [user.email],
-                        fail_silently=True,
-                    )
-                except Exception:
-                    pass  # Email sending failed, but registration succeeded
+                transaction.on_commit(lambda: _queue_welcome_email(user.id))
             
             return Response({
                 'message': 'User registered successfully',
-                'user': UserSerializer(user).data,
+                'user': UserSerializer(self._load_user(user.pk)).data,
                 'tokens': {
                     'refresh': str(refresh),
                     'access': str(refresh.access_token),
@@ -104,14 +131,13 @@ class AuthenticationViewSet(GenericViewSet):
     @action(detail=False, methods=['post'])
     def login(self, request):
         """Enhanced user login endpoint with session tracking"""
-        serializer = UserLoginSerializer(data=request.data)
+        serializer = UserLoginSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             user = serializer.validated_data['user']
             remember_me = serializer.validated_data.get('remember_me', False)
             
-            # Update last login
-            user.last_login = timezone.now()
-            user.save(update_fields=['last_login'])
+            # Update last login with a single UPDATE, bypassing the model save path
+            CustomUser.objects.filter(pk=user.pk).update(last_login=timezone.now())
             
             # Generate tokens with custom expiry
             refresh = RefreshToken.for_user(user)
@@ -121,7 +147,7 @@ class AuthenticationViewSet(GenericViewSet):
             
             return Response({
                 'message': 'Login successful',
-                'user': UserSerializer(user).data,
+                'user': UserSerializer(self._load_user(user.pk)).data,
                 'tokens': {
                     'refresh': str(refresh),
                     'access': str(refresh.access_token),
@@ -150,7 +176,7 @@ class AuthenticationViewSet(GenericViewSet):
     @action(detail=False, methods=['get'])
     def profile(self, request):
         """Get current user profile"""
-        serializer = UserSerializer(request.user)
+        serializer = UserSerializer(self._load_user(request.user.pk))
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     @action(detail=False, methods=['put', 'patch'])
@@ -167,7 +193,7 @@ class AuthenticationViewSet(GenericViewSet):
             serializer.save()
             return Response({
                 'message': 'Profile updated successfully',
-                'user': UserSerializer(request.user).data
+                'user': UserSerializer(self._load_user(request.user.pk)).data
             }, status=status.HTTP_200_OK)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -182,11 +208,13 @@ class AuthenticationViewSet(GenericViewSet):
         if serializer.is_valid():
             user = request.user
             user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            user.save(update_fields=['password'])
             
-            # Invalidate all existing tokens for security
+            # Invalidate the session's current refresh token and issue a fresh pair
+            old_refresh = serializer.validated_data.get('old_refresh_token')
+            if old_refresh is not None:
+                old_refresh.blacklist()
             refresh = RefreshToken.for_user(user)
-            refresh.blacklist()
             
             return Response({
                 'message': 'Password changed successfully',
@@ -206,27 +234,26 @@ class AuthenticationViewSet(GenericViewSet):
             email = serializer.validated_data['email']
             user = CustomUser.objects.get(email=email)
             
-            # Generate reset token
+            # Generate reset token, keeping only its digest server-side
             reset_token = str(uuid.uuid4())
-            # In production, store this token in cache or database with expiry
+            cache.set(
+                PASSWORD_RESET_KEY.format(user_id=user.pk),
+                hash_reset_token(reset_token),
+                timeout=PASSWORD_RESET_TIMEOUT
+            )
             
             # Send reset email
             if hasattr(settings, 'EMAIL_HOST_USER'):
                 try:
-                    send_mail(
-                        'Password Reset Request',
-                        f'Use this token to reset your password: {reset_token}',
-                        settings.EMAIL_HOST_USER,
-                        [email],
-                        fail_silently=False,
-                    )
-                    return Response({
-                        'message': 'Password reset email sent successfully'
-                    }, status=status.HTTP_200_OK)
+                    send_reset_email.delay(email, reset_token)
                 except Exception:
+                    logger.exception("Failed to queue password reset email")
                     return Response({
                         'error': 'Failed to send reset email'
                     }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                return Response({
+                    'message': 'Password reset email sent successfully'
+                }, status=status.HTTP_200_OK)
             
             return Response({
                 'message': 'Password reset functionality not configured'
@@ -234,6 +261,24 @@ class AuthenticationViewSet(GenericViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    @action(detail=False, methods=['post'])
+    def password_reset_confirm(self, request):
+        """Set a new password using a reset token"""
+        serializer = PasswordResetConfirmSerializer(data=request.data)
+        if serializer.is_valid():
+            user = serializer.validated_data['user']
+            user.set_password(serializer.validated_data['new_password'])
+            user.save(update_fields=['password'])
+            
+            # Reset tokens are single use
+            cache.delete(PASSWORD_RESET_KEY.format(user_id=user.pk))
+            
+            return Response({
+                'message': 'Password reset successfully'
+            }, status=status.HTTP_200_OK)
+        
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
     @action(detail=False, methods=['post'])
     def verify_email(self, request):
         """Email verification endpoint"""
@@ -251,8 +296,10 @@ class UserProfileViewSet(RetrieveModelMixin, UpdateModelMixin, GenericViewSet):
     
     def get_object(self):
         """Get current user's profile"""
-        profile, created = UserProfile.objects.get_or_create(user=self.request.user)
-        return profile
+        try:
+            return UserProfile.objects.select_related('user').get(user=self.request.user)
+        except UserProfile.DoesNotExist:
+            return UserProfile.objects.create(user=self.request.user)
     
     def retrieve(self, request, *args, **kwargs):
         """Get user profile"""
@@ -272,58 +319,3 @@ class UserProfileViewSet(RetrieveModelMixin, UpdateModelMixin, GenericViewSet):
             'message': 'Profile updated successfully',
             'data': serializer.data
         })
-
-
-# Legacy API views for backward compatibility
-@api_view(['POST'])
-@permission_classes([AllowAny])
-def register(request):
-    """Legacy registration endpoint"""
-    viewset = AuthenticationViewSet()
-    viewset.action = 'register'
-    return viewset.register(request)
-
-
-@api_view(['POST'])
-@permission_classes([AllowAny])
-def login(request):
-    """Legacy login endpoint"""
-    viewset = AuthenticationViewSet()
-    viewset.action = 'login'
-    return viewset.login(request)
-
-
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def logout(request):
-    """Legacy logout endpoint"""
-    viewset = AuthenticationViewSet()
-    viewset.action = 'logout'
-    return viewset.logout(request)
-
-
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def profile(request):
-    """Legacy profile endpoint"""
-    viewset = AuthenticationViewSet()
-    viewset.action = 'profile'
-    return viewset.profile(request)
-
-
-@api_view(['PUT'])
-@permission_classes([IsAuthenticated])
-def update_profile(request):
-    """Legacy update profile endpoint"""
-    viewset = AuthenticationViewSet()
-    viewset.action = 'update_profile'
-    return viewset.update_profile(request)
-
-
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def change_password(request):
-    """Legacy change password endpoint"""
-    viewset = AuthenticationViewSet()
-    viewset.action = 'change_password'
-    return viewset.change_password(request)
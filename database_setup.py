@@ -7,15 +7,23 @@ Run this script to configure the database for the Django application.
 
 import os
 import sys
+from functools import partial
 import django
 from django.conf import settings
-from django.core.management import execute_from_command_line
-from django.db import connection
+from django.core.management import call_command
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError, connection, transaction
 from django.core.management.base import BaseCommand
 
 
-# MySQL Database Configuration for settings.py
-MYSQL_DATABASE_CONFIG = """
+# The generated files are built by functions rather than kept as module-level
+# strings, so importing this module (e.g. for build_database_config) doesn't
+# hold every script in memory, and callers only build the pieces they write.
+
+def mysql_settings_snippet():
+    """MySQL DATABASES block to paste into settings.py"""
+    return '\n'.join([
+        """
 # MySQL Database Configuration
 DATABASES = {
     'default': {
@@ -30,187 +38,345 @@ DATABASES = {
             'charset': 'utf8mb4',
             'use_unicode': True,
         },
-        'CONN_MAX_AGE': 60,
-        'ATOMIC_REQUESTS': True,
+        # Keep connections open across requests; set DB_CONN_MAX_AGE=0 behind a pooler
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 600)),
+        # Ping reused connections before the first query instead of failing mid-request
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+        # ATOMIC_REQUESTS is intentionally off: it would wrap every request, reads
+        # included, in BEGIN/COMMIT. Wrap write views in transaction.atomic instead.
+        'ATOMIC_REQUESTS': False,
+        # Django's default; each read runs in its own implicit transaction
+        'AUTOCOMMIT': True,
     }
 }
+""",
+        """# Database connection pooling (optional, requires django-db-connection-pool[mysql])
+if os.getenv('DB_POOL_ENABLE') == '1':
+    DATABASES['default']['ENGINE'] = 'dj_db_conn_pool.backends.mysql'
+    DATABASES['default']['POOL_OPTIONS'] = {
+        'POOL_SIZE': int(os.getenv('DB_POOL_MIN_SIZE', 5)),
+        'MAX_OVERFLOW': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+        'RECYCLE': int(os.getenv('DB_POOL_RECYCLE', 3600)),
+        'TIMEOUT': 10,
+    }
+    # The pool manages connection lifetime, so persistent connections must be off
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+""",
+        """# Or, instead of copying this block:
+# from database_setup import build_database_config
+# DATABASES = build_database_config()
+""",
+    ])
+
+
+def env_template():
+    """Environment variables template for the .env file"""
+    sections = [
+        ('Database Configuration', [
+            'DB_NAME=scholarship_portal_db',
+            'DB_USER=root',
+            'DB_PASSWORD=your_mysql_password_here',
+            'DB_HOST=localhost',
+            'DB_PORT=3306',
+            'DB_CONN_MAX_AGE=600',
+            'DB_POOL_ENABLE=0',
+        ]),
+        ('Django Configuration', [
+            'SECRET_KEY=your-secret-key-here',
+            'DEBUG=True',
+            'ALLOWED_HOSTS=localhost,127.0.0.1',
+        ]),
+        ('JWT Configuration', [
+            'JWT_ACCESS_TOKEN_LIFETIME=60',
+            'JWT_REFRESH_TOKEN_LIFETIME=10080',
+        ]),
+        ('Media and Static Files', [
+            'MEDIA_ROOT=media/',
+            'STATIC_ROOT=staticfiles/',
+        ]),
+    ]
+    return '\n' + '\n'.join(
+        '\n'.join([f'# {title}', *lines, '']) for title, lines in sections
+    )
+
+
+def mysql_ddl():
+    """MySQL database and user creation script, run as the MySQL root user"""
+    return '\n'.join([
+        '',
+        '-- MySQL Database Setup Script for Student Scholarship Portal',
+        '-- Run this script as MySQL root user',
+        '',
+        '-- Create database',
+        'CREATE DATABASE IF NOT EXISTS scholarship_portal_db CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;',
+        '',
+        '-- Create application user',
+        "CREATE USER IF NOT EXISTS 'scholarship_user'@'localhost' IDENTIFIED BY 'scholarship_password_123';",
+        '',
+        '-- Grant privileges',
+        "GRANT ALL PRIVILEGES ON scholarship_portal_db.* TO 'scholarship_user'@'localhost';",
+        "GRANT SELECT, INSERT, UPDATE, DELETE, CREATE, DROP, INDEX, ALTER ON scholarship_portal_db.* TO 'scholarship_user'@'localhost';",
+        '',
+        '-- Flush privileges',
+        'FLUSH PRIVILEGES;',
+        '',
+        '-- Use the database',
+        'USE scholarship_portal_db;',
+        '',
+        '-- Show database info',
+        "SELECT 'Database created successfully!' as message;",
+        "SHOW DATABASES LIKE 'scholarship_portal_db';",
+        '',
+    ])
+
+
+# Django management commands for setup, as (command, args, options) for call_command.
+# Apps are passed to a single makemigrations so the autodetector runs once; they
+# must be named because none of them has a migrations package yet.
+DJANGO_SETUP_COMMANDS = [
+    ('makemigrations', (
+        'authentication', 'students', 'institutes',
+        'departments', 'finance', 'grievances',
+    ), {}),
+    ('migrate', (), {}),
+    ('collectstatic', (), {'interactive': False}),
+]
 
-# Database connection pooling (optional)
-# Uncomment if using django-db-pool
-# DATABASES['default']['ENGINE'] = 'django_db_pool.backends.mysql'
-# DATABASES['default']['POOL_OPTIONS'] = {
-#     'POOL_SIZE': 10,
-#     'MAX_OVERFLOW': 20,
-#     'RECYCLE': 24 * 60 * 60,  # 24 hours
-# }
-"""
-
-# Environment variables template for .env file
-ENV_TEMPLATE = """
-# Database Configuration
-DB_NAME=scholarship_portal_db
-DB_USER=root
-DB_PASSWORD=your_mysql_password_here
-DB_HOST=localhost
-DB_PORT=3306
-
-# Django Configuration
-SECRET_KEY=your-secret-key-here
-DEBUG=True
-ALLOWED_HOSTS=localhost,127.0.0.1
-
-# JWT Configuration
-JWT_ACCESS_TOKEN_LIFETIME=60
-JWT_REFRESH_TOKEN_LIFETIME=10080
-
-# Media and Static Files
-MEDIA_ROOT=media/
-STATIC_ROOT=staticfiles/
-"""
-
-# MySQL database creation script
-MYSQL_SETUP_SCRIPT = """
--- MySQL Database Setup Script for Student Scholarship Portal
--- Run this script as MySQL root user
-
--- Create database
-CREATE DATABASE IF NOT EXISTS scholarship_portal_db CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
-
--- Create application user
-CREATE USER IF NOT EXISTS 'scholarship_user'@'localhost' IDENTIFIED BY 'scholarship_password_123';
 
--- Grant privileges
-GRANT ALL PRIVILEGES ON scholarship_portal_db.* TO 'scholarship_user'@'localhost';
-GRANT SELECT, INSERT, UPDATE, DELETE, CREATE, DROP, INDEX, ALTER ON scholarship_portal_db.* TO 'scholarship_user'@'localhost';
+# Table names below are the models' Meta.db_table values, not Django's
+# app_model defaults
 
--- Flush privileges
-FLUSH PRIVILEGES;
+def _critical_indexes():
+    """Indexes needed from the first request (login and primary lookups)"""
+    yield """
+-- Critical indexes for Student Scholarship Portal
 
--- Use the database
 USE scholarship_portal_db;
-
--- Show database info
-SELECT 'Database created successfully!' as message;
-SHOW DATABASES LIKE 'scholarship_portal_db';
+"""
+    yield """
+-- Authentication indexes
+CREATE INDEX idx_user_email ON auth_users(email);
+-- Boolean flags are near-constant, so they only trail a selective column
+CREATE INDEX idx_user_type_active ON auth_users(user_type, is_active);
+"""
+    yield """
+-- Primary lookup indexes
+CREATE INDEX idx_student_id ON students(student_id);
+CREATE INDEX idx_institute_code ON institutes(code);
+"""
+    yield """
+SELECT 'Critical indexes created successfully!' as message;
 """
 
-# Django management commands for setup
-DJANGO_SETUP_COMMANDS = [
-    'makemigrations',
-    'makemigrations authentication',
-    'makemigrations students',
-    'makemigrations institutes',
-    'makemigrations departments',
-    'makemigrations finance',
-    'makemigrations grievances',
-    'migrate',
-    'collectstatic --noinput',
-]
 
-# MySQL indexes for performance optimization
-MYSQL_INDEXES_SCRIPT = """
+def _analytics_indexes():
+    """Secondary and composite indexes for reporting/analytics queries"""
+    yield """
 -- Performance optimization indexes for Student Scholarship Portal
 
 USE scholarship_portal_db;
-
--- Authentication indexes
-CREATE INDEX idx_user_email ON authentication_customuser(email);
-CREATE INDEX idx_user_type ON authentication_customuser(user_type);
-CREATE INDEX idx_user_active ON authentication_customuser(is_active);
-
+"""
+    yield """
 -- Student indexes
-CREATE INDEX idx_student_id ON students_student(student_id);
-CREATE INDEX idx_student_institute ON students_student(institute_id);
-CREATE INDEX idx_student_department ON students_student(department_id);
-CREATE INDEX idx_student_course_level ON students_student(course_level);
-CREATE INDEX idx_student_academic_year ON students_student(academic_year);
-CREATE INDEX idx_student_verified ON students_student(is_verified);
-CREATE INDEX idx_student_enrollment ON students_student(enrollment_date);
-
+CREATE INDEX idx_student_department ON students(department_id);
+CREATE INDEX idx_student_course_level ON students(course_level);
+CREATE INDEX idx_student_year_verified ON students(academic_year, is_verified);
+CREATE INDEX idx_student_enrollment ON students(enrollment_date);
+"""
+    yield """
 -- Document indexes
-CREATE INDEX idx_document_student ON students_studentdocument(student_id);
-CREATE INDEX idx_document_type ON students_studentdocument(document_type);
-CREATE INDEX idx_document_verified ON students_studentdocument(is_verified);
-CREATE INDEX idx_document_uploaded ON students_studentdocument(uploaded_at);
-
+CREATE INDEX idx_document_type_verified ON student_documents(document_type, is_verified);
+CREATE INDEX idx_document_uploaded ON student_documents(uploaded_at);
+"""
+    yield """
 -- Application indexes
-CREATE INDEX idx_application_student ON students_scholarshipapplication(student_id);
-CREATE INDEX idx_application_status ON students_scholarshipapplication(status);
-CREATE INDEX idx_application_type ON students_scholarshipapplication(scholarship_type);
-CREATE INDEX idx_application_created ON students_scholarshipapplication(created_at);
-CREATE INDEX idx_application_submitted ON students_scholarshipapplication(submitted_at);
-CREATE INDEX idx_application_year ON students_scholarshipapplication(academic_year);
-
+-- Covering: WHERE status = ? ORDER BY created_at reads student_id from the index
+CREATE INDEX idx_application_status_created ON scholarship_applications(status, created_at, student_id);
+CREATE INDEX idx_application_type ON scholarship_applications(scholarship_type);
+CREATE INDEX idx_application_submitted ON scholarship_applications(submitted_at);
+CREATE INDEX idx_application_year ON scholarship_applications(academic_year);
+"""
+    yield """
 -- Institute indexes
-CREATE INDEX idx_institute_code ON institutes_institute(code);
-CREATE INDEX idx_institute_verified ON institutes_institute(is_verified);
-CREATE INDEX idx_institute_type ON institutes_institute(institute_type);
-CREATE INDEX idx_institute_state ON institutes_institute(state);
+CREATE INDEX idx_institute_type_active ON institutes(institute_type, is_active);
+CREATE INDEX idx_institute_state ON institutes(state);
+"""
+    yield """
+-- Departments admin search.
+-- Code and employee_id are searched by prefix ('^' in search_fields), which a
+-- B-tree serves. faculty.employee_id is already UNIQUE so it needs nothing extra.
+CREATE INDEX idx_department_code ON departments(code);
+CREATE INDEX idx_course_code ON courses(code);
+CREATE INDEX idx_subject_code ON subjects(code);
+"""
+    yield """
+-- Composite indexes for common queries. Each also serves lookups on its
+-- leading column alone, so no separate single-column index is kept for it.
+
+-- Institute dashboards list one institute's students across years:
+-- WHERE institute_id = ? [AND academic_year = ?]
+CREATE INDEX idx_student_institute_year ON students(institute_id, academic_year);
+
+-- A student's applications, optionally by status: WHERE student_id = ? [AND status = ?]
+CREATE INDEX idx_application_student_status ON scholarship_applications(student_id, status);
 
--- Composite indexes for common queries
-CREATE INDEX idx_student_institute_year ON students_student(institute_id, academic_year);
-CREATE INDEX idx_application_student_status ON students_scholarshipapplication(student_id, status);
-CREATE INDEX idx_document_student_type ON students_studentdocument(student_id, document_type);
-CREATE INDEX idx_application_status_created ON students_scholarshipapplication(status, created_at);
+-- A student's documents, optionally by type: WHERE student_id = ? [AND document_type = ?]
+CREATE INDEX idx_document_student_type ON student_documents(student_id, document_type);
 
+-- Recent applications, with or without a status filter:
+-- WHERE created_at > ? [AND status = ?] ORDER BY created_at
+CREATE INDEX idx_application_created_status ON scholarship_applications(created_at, status);
+"""
+    yield """
 -- Show created indexes
 SELECT 'Indexes created successfully!' as message;
 """
 
 
+def mysql_indexes_ddl(stage='analytics'):
+    """Yield the index script for a stage section by section.
+    
+    'critical' indexes are created right after migrate. 'analytics' indexes are
+    created last, after any bulk data load, so the load doesn't pay B-tree
+    maintenance per row and each index is built in a single pass.
+    """
+    if stage == 'critical':
+        return _critical_indexes()
+    if stage == 'analytics':
+        return _analytics_indexes()
+    raise ValueError(f"Unknown index stage: {stage}")
+
+
+def build_database_config():
+    """Build the DATABASES setting for MySQL, with optional connection pooling"""
+    default = {
+        'ENGINE': 'django.db.backends.mysql',
+        'NAME': os.getenv('DB_NAME', 'scholarship_portal_db'),
+        'USER': os.getenv('DB_USER', 'root'),
+        'PASSWORD': os.getenv('DB_PASSWORD', 'your_mysql_password'),
+        'HOST': os.getenv('DB_HOST', 'localhost'),
+        'PORT': os.getenv('DB_PORT', '3306'),
+        'OPTIONS': {
+            'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
+            'charset': 'utf8mb4',
+            'use_unicode': True,
+        },
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+    }
+    
+    if os.getenv('DB_POOL_ENABLE') == '1':
+        default['ENGINE'] = 'dj_db_conn_pool.backends.mysql'
+        default['POOL_OPTIONS'] = {
+            'POOL_SIZE': int(os.getenv('DB_POOL_MIN_SIZE', 5)),
+            'MAX_OVERFLOW': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+            'RECYCLE': int(os.getenv('DB_POOL_RECYCLE', 3600)),
+            'TIMEOUT': 10,
+        }
+        # The pool manages connection lifetime, so persistent connections must be off
+        default['CONN_MAX_AGE'] = 0
+    
+    return {'default': default}
+
+
 def create_env_file():
     """Create .env file with template values"""
     env_path = os.path.join(os.getcwd(), '.env')
     if not os.path.exists(env_path):
-        with open(env_path, 'w') as f:
-            f.write(ENV_TEMPLATE)
+        _write_file(env_path, [env_template()])
         print(f"✅ Created .env file at {env_path}")
         print("⚠️  Please update the database credentials in .env file")
     else:
         print("ℹ️  .env file already exists")
 
 
+def _write_file(path, chunks):
+    """Write chunks of text to a file, one chunk at a time"""
+    with open(path, 'w') as f:
+        f.writelines(chunks)
+
+
 def create_mysql_script():
     """Create MySQL setup script file"""
     script_path = os.path.join(os.getcwd(), 'mysql_setup.sql')
-    with open(script_path, 'w') as f:
-        f.write(MYSQL_SETUP_SCRIPT)
+    _write_file(script_path, [mysql_ddl()])
     print(f"✅ Created MySQL setup script at {script_path}")
     
-    # Create indexes script
-    indexes_path = os.path.join(os.getcwd(), 'mysql_indexes.sql')
-    with open(indexes_path, 'w') as f:
-        f.write(MYSQL_INDEXES_SCRIPT)
-    print(f"✅ Created MySQL indexes script at {indexes_path}")
+    # Create indexes scripts: critical ones right after migrate, analytics ones last
+    for stage in ('critical', 'analytics'):
+        indexes_path = os.path.join(os.getcwd(), f'mysql_indexes_{stage}.sql')
+        _write_file(indexes_path, mysql_indexes_ddl(stage))
+        print(f"✅ Created MySQL indexes script at {indexes_path}")
+
+
+def _sql_statements(sections):
+    """Split index script sections into executable statements, skipping comments and USE/SELECT"""
+    # Drop comment lines before splitting, so a ';' inside a comment can't split a statement
+    script = '\n'.join(
+        line for line in ''.join(sections).splitlines() if not line.lstrip().startswith('--')
+    )
+    for statement in script.split(';'):
+        statement = statement.strip()
+        if statement and statement.split(None, 1)[0].upper() not in ('USE', 'SELECT'):
+            yield statement
+
+
+def load_then_index(fixture_path):
+    """Bulk-load a fixture with InnoDB checks relaxed, then build the analytics indexes"""
+    print(f"📦 Loading {fixture_path} before creating secondary indexes...")
+    with connection.cursor() as cursor:
+        # Session-level settings: skip per-row uniqueness and FK checks during the load
+        cursor.execute("SET unique_checks=0")
+        cursor.execute("SET foreign_key_checks=0")
+        try:
+            call_command('loaddata', fixture_path)
+        finally:
+            cursor.execute("SET foreign_key_checks=1")
+            cursor.execute("SET unique_checks=1")
+        
+        for statement in _sql_statements(mysql_indexes_ddl('analytics')):
+            cursor.execute(statement)
+    print("✅ Data loaded and analytics indexes created")
+
+
+def _setup_django():
+    """Set up the Django environment once; every command runs in this process"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'scholarship_portal.settings')
+    django.setup()
 
 
 def run_django_setup():
     """Run Django setup commands"""
     print("🚀 Running Django setup commands...")
     
-    # Set up Django environment
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'scholarship_portal.settings')
-    django.setup()
+    _setup_django()
     
-    for command in DJANGO_SETUP_COMMANDS:
+    # Open the connection once so all commands share it
+    connection.ensure_connection()
+    
+    for command, args, options in DJANGO_SETUP_COMMANDS:
+        label = ' '.join((command,) + args)
         try:
-            print(f"Running: python manage.py {command}")
-            execute_from_command_line(['manage.py'] + command.split())
-            print(f"✅ {command} completed successfully")
+            print(f"Running: python manage.py {label}")
+            call_command(command, *args, **options)
+            print(f"✅ {label} completed successfully")
         except Exception as e:
-            print(f"❌ Error running {command}: {str(e)}")
+            print(f"❌ Error running {label}: {str(e)}")
             continue
 
 
 def check_database_connection():
     """Check if database connection is working"""
     try:
-        from django.db import connection
-        cursor = connection.cursor()
-        cursor.execute("SELECT 1")
+        _setup_django()
+        # Connect (or reuse the open connection) and ping the server; on MySQL
+        # is_usable() is a single COM_PING rather than a parsed SELECT 1
+        connection.ensure_connection()
+        if not connection.is_usable():
+            raise OperationalError("server did not answer ping")
         print("✅ Database connection successful")
         return True
-    except Exception as e:
+    except (OperationalError, ImproperlyConfigured) as e:
         print(f"❌ Database connection failed: {str(e)}")
         return False
 
@@ -220,17 +386,27 @@ def create_superuser():
     print("👤 Creating Django superuser...")
     try:
         from django.contrib.auth import get_user_model
+        from django.contrib.auth.hashers import make_password
         User = get_user_model()
         
-        if not User.objects.filter(username='admin').exists():
-            User.objects.create_superuser(
+        # One atomic get-or-insert. The hashed password goes in with the row, so
+        # there is no follow-up UPDATE; it is a callable so an existing admin
+        # doesn't pay for hashing.
+        with transaction.atomic():
+            _, created = User.objects.get_or_create(
                 username='admin',
-                email='admin@scholarship.portal',
-                password='admin123',
-                first_name='System',
-                last_name='Administrator',
-                user_type='system_admin'
+                defaults={
+                    'email': 'admin@scholarship.portal',
+                    'password': partial(make_password, 'admin123'),
+                    'first_name': 'System',
+                    'last_name': 'Administrator',
+                    'user_type': 'super_admin',
+                    'is_staff': True,
+                    'is_superuser': True,
+                },
             )
+        
+        if created:
             print("✅ Superuser 'admin' created with password 'admin123'")
             print("⚠️  Please change the default password after first login")
         else:
@@ -257,10 +433,17 @@ def main():
     print("   pip install -r requirements.txt")
     print("5. Run Django migrations:")
     print("   python manage.py migrate")
-    print("6. Create superuser:")
+    print("6. Create the critical indexes:")
+    print("   mysql -u root -p < mysql_indexes_critical.sql")
+    print("7. Load any fixture or dump data, then create superuser:")
     print("   python manage.py createsuperuser")
-    print("7. Run development server:")
+    print("8. Create the analytics indexes as the final step:")
+    print("   mysql -u root -p < mysql_indexes_analytics.sql")
+    print("9. Run development server:")
     print("   python manage.py runserver")
+    print("\n💡 Transactions: wrap POST/PUT views in @transaction.atomic explicitly;")
+    print("   avoid ATOMIC_REQUESTS at the database level to keep GET latency low")
+    print("   and allow CONN_MAX_AGE to amortize the handshake across requests.")
     
     # Ask if user wants to run Django setup
     response = input("\n🤔 Do you want to run Django setup now? (y/n): ")
@@ -1,37 +1,43 @@
 from django.contrib import admin
-from .models import Department, Course, DepartmentAdmin, Subject, Faculty
+from scholarship_portal.admin_mixins import ListDisplayOnlyMixin
+from .models import Department, Course, DepartmentAdmin as DepartmentAdminModel, Subject, Faculty
 
 
 @admin.register(Department)
-class DepartmentAdmin(admin.ModelAdmin):
+class DepartmentAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('code', 'name', 'institute', 'department_type', 'is_active')
-    list_filter = ('institute', 'department_type', 'is_active')
-    search_fields = ('name', 'code', 'institute__name')
+    list_filter = (('institute', admin.RelatedOnlyFieldListFilter), 'department_type', 'is_active')
+    list_select_related = ('institute',)
+    search_fields = ('name', '^code', 'institute__name')
 
 
 @admin.register(Course)
-class CourseAdmin(admin.ModelAdmin):
+class CourseAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('code', 'name', 'department', 'course_type', 'duration_years', 'is_active')
-    list_filter = ('department', 'course_type', 'is_active')
-    search_fields = ('name', 'code', 'department__name')
+    list_filter = (('department', admin.RelatedOnlyFieldListFilter), 'course_type', 'is_active')
+    list_select_related = ('department__institute',)
+    search_fields = ('name', '^code', 'department__name')
 
 
-@admin.register(DepartmentAdmin)
-class DepartmentAdminAdmin(admin.ModelAdmin):
+@admin.register(DepartmentAdminModel)
+class DepartmentAdminAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('user', 'department', 'designation', 'employee_id', 'is_primary_admin')
-    list_filter = ('department', 'is_primary_admin')
-    search_fields = ('user__username', 'employee_id', 'department__name')
+    list_filter = (('department', admin.RelatedOnlyFieldListFilter), 'is_primary_admin')
+    list_select_related = ('user', 'department__institute')
+    search_fields = ('user__username', '^employee_id', 'department__name')
 
 
 @admin.register(Subject)
-class SubjectAdmin(admin.ModelAdmin):
+class SubjectAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('code', 'name', 'course', 'subject_type', 'credits', 'semester')
-    list_filter = ('course', 'subject_type', 'semester')
-    search_fields = ('name', 'code', 'course__name')
+    list_filter = (('course', admin.RelatedOnlyFieldListFilter), 'subject_type', 'semester')
+    list_select_related = ('course__department',)
+    search_fields = ('name', '^code', 'course__name')
 
 
 @admin.register(Faculty)
-class FacultyAdmin(admin.ModelAdmin):
+class FacultyAdmin(ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ('employee_id', 'user', 'department', 'designation', 'is_active')
-    list_filter = ('department', 'designation', 'is_active')
-    search_fields = ('employee_id', 'user__username', 'user__first_name', 'user__last_name')
+    list_filter = (('department', admin.RelatedOnlyFieldListFilter), 'designation', 'is_active')
+    list_select_related = ('user', 'department__institute')
+    search_fields = ('^employee_id', 'user__username', 'user__first_name', 'user__last_name')
@@ -0,0 +1,38 @@
+"""
+Versioned cache keys for department application data
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+
+# Cached department application data is keyed by a per-department version that
+# every committed application write bumps, so stale entries are simply never read
+APPS_VERSION_KEY = 'dept:{department_id}:apps:ver'
+
+# Dashboard and list summary payloads are plain dicts of primitives, so they
+# live in a cache with a compact serializer when the settings provide one
+DASHBOARD_CACHE_ALIAS = 'dashboards'
+
+
+def dashboard_cache():
+    """Cache backend for department dashboard and summary payloads"""
+    if DASHBOARD_CACHE_ALIAS in settings.CACHES:
+        return caches[DASHBOARD_CACHE_ALIAS]
+    return caches[DEFAULT_CACHE_ALIAS]
+
+
+def applications_version(department_id):
+    """Current cache version for a department's application data"""
+    # Seeded from the clock so a version lost to eviction can't restart at an old value
+    return cache.get_or_set(APPS_VERSION_KEY.format(department_id=department_id), time.time_ns, None)
+
+
+def bump_applications_version(department_id):
+    """Invalidate a department's cached application data"""
+    key = APPS_VERSION_KEY.format(department_id=department_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
@@ -4,18 +4,15 @@ Comprehensive Django REST Framework views for Department administration
 """
 
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count, Sum, Avg, F, Case, When, IntegerField, Value
-from django.db.models.functions import TruncMonth, TruncWeek, TruncDay
+from django.db.models import Q, Count, Sum, Avg, F, Case, When, IntegerField, CharField, Value
+from django.db.models.functions import Coalesce, TruncWeek, TruncDay
 from django.utils import timezone
 from django.contrib.auth import get_user_model
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.core.paginator import Paginator
-from django.core.cache import cache
 from django.db import transaction
-from django.core.mail import send_mail
-from django.conf import settings
 
-from rest_framework import generics, status, permissions
+from rest_framework import generics, status, permissions, serializers
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -27,27 +24,82 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExampl
 
 import logging
 import csv
+import hashlib
 import io
+from itertools import islice
 from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
 from collections import defaultdict
-import json
-import requests
 
 from .models import Department, DepartmentAdmin, Course, Subject, Faculty
 from students.models import Student, ScholarshipApplication, StudentDocument, DocumentVerification
+from students.expressions import AppendNote, AsFloat, NoteForAction
 from .department_serializers import (
     DepartmentSerializer, DepartmentAdminSerializer, DepartmentDetailSerializer,
     VerifiedApplicationListSerializer, ApplicationReviewSerializer,
     ApplicationForwardSerializer, DepartmentDashboardSerializer,
     DepartmentReportSerializer, ApplicationDecisionSerializer,
-    ForwardedApplicationTrackingSerializer, DepartmentStatisticsSerializer
+    ForwardedApplicationTrackingSerializer, DepartmentStatisticsSerializer,
+    DEPT_STATUS_LABELS, processing_priority_label
 )
 from .permissions import DepartmentAdminPermission, DepartmentReportsPermission
+from .tasks import notify_finance_module, send_finance_email
+from .caching import applications_version, bump_applications_version, dashboard_cache
 from authentication.permissions import IsAuthenticated
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Forwarding to finance keeps the department approval, so both states count as approved
+DEPT_APPROVED_STATES = ('approved', 'forwarded')
+# internal_notes action recorded for each department review state
+DEPT_STATE_ACTIONS = {
+    'approved': 'DEPT_APPROVED',
+    'rejected': 'DEPT_REJECTED',
+    'forwarded': 'FORWARDED_TO_FINANCE',
+}
+
+# Cached summaries and dashboards are keyed by the department's application
+# version (see caching.py), which every committed application write bumps
+SUMMARY_CACHE_TIMEOUT = 300
+# Writes move dashboards to a new version; the short TTL bounds drift in the
+# clock-based figures (overdue reviews, the monthly window, generated_at)
+DASHBOARD_CACHE_TIMEOUT = 60
+# Query params that change the page but not the summary
+PAGINATION_PARAMS = frozenset({'page', 'page_size', 'fields'})
+# Renders datetimes in the same format as the serializer-backed endpoints
+API_DATETIME = serializers.DateTimeField()
+# DEPT_STATUS_LABELS computed by the database, for report projections
+DEPT_STATUS_LABEL = Case(
+    *[When(dept_review_state=state, then=Value(label)) for state, label in DEPT_STATUS_LABELS.items()],
+    default=Value('pending_review'),
+    output_field=CharField()
+)
+
+# Shared report filters, combined into single conditional aggregates
+INSTITUTE_APPROVED_Q = Q(status__in=['approved', 'partially_approved'])
+DEPT_PENDING_Q = Q(dept_review_state='pending')
+DEPT_APPROVED_Q = Q(dept_review_state__in=DEPT_APPROVED_STATES)
+DEPT_REJECTED_Q = Q(dept_review_state='rejected')
+FORWARDED_Q = Q(dept_review_state='forwarded')
+# Department reviews still pending this long after institute approval are overdue
+OVERDUE_REVIEW_AGE = timedelta(days=7)
+# CSV exports are formatted and streamed this many rows at a time
+CSV_BATCH_SIZE = 2000
+# Report sections DepartmentReportSerializer returns unchanged (plain dicts and
+# lists of dicts), handed to the renderer as built instead of walked row by row
+REPORT_PASSTHROUGH_FIELDS = ('applications', 'course_analysis', 'amount_range_analysis', 'financial_summary')
+
+
+def get_department(request):
+    """Department of the requesting admin, looked up once per request"""
+    # Department admin permissions already load the profile onto request.dept_admin
+    dept_admin = getattr(request, 'dept_admin', None)
+    if dept_admin is None:
+        dept_admin = DepartmentAdmin.objects.select_related('department').get(user=request.user)
+        request.dept_admin = dept_admin
+    return dept_admin.department
+
 
 class StandardResultsSetPagination(PageNumberPagination):
     """Standard pagination for department module"""
@@ -71,15 +123,14 @@ class VerifiedApplicationsListView(generics.ListAPIView):
 
     def get_queryset(self):
         """Filter applications for department with comprehensive filtering"""
-        user = self.request.user
-        department = user.department_admin_profile.department
+        department = get_department(self.request)
         
-        # Base queryset - only verified applications from institute
-        queryset = ScholarshipApplication.objects.select_related(
-            'student', 'student__user', 'student__institute', 'student__department',
-            'assigned_to', 'reviewed_by', 'approved_by'
-        ).prefetch_related(
-            'student__documents'
+        # Base queryset - only verified applications from institute, joined and
+        # narrowed to what VerifiedApplicationListSerializer renders
+        queryset = VerifiedApplicationListSerializer.setup_eager_loading(
+            ScholarshipApplication.objects.all()
+        ).annotate(
+            processing_priority_label=processing_priority_label(timezone.now())
         ).filter(
             student__department=department,
             status__in=['approved', 'partially_approved'],  # Only institute-approved applications
@@ -90,20 +141,13 @@ class VerifiedApplicationsListView(generics.ListAPIView):
         dept_status = self.request.query_params.get('dept_status', 'pending_review')
         if dept_status == 'pending_review':
             # Applications awaiting department review
-            queryset = queryset.filter(
-                Q(status='approved') | Q(status='partially_approved')
-            ).exclude(
-                # Exclude already processed by department
-                internal_notes__icontains='DEPT_APPROVED'
-            ).exclude(
-                internal_notes__icontains='DEPT_REJECTED'
-            )
+            queryset = queryset.filter(DEPT_PENDING_Q)
         elif dept_status == 'dept_approved':
-            queryset = queryset.filter(internal_notes__icontains='DEPT_APPROVED')
+            queryset = queryset.filter(DEPT_APPROVED_Q)
         elif dept_status == 'dept_rejected':
-            queryset = queryset.filter(internal_notes__icontains='DEPT_REJECTED')
+            queryset = queryset.filter(DEPT_REJECTED_Q)
         elif dept_status == 'forwarded_to_finance':
-            queryset = queryset.filter(internal_notes__icontains='FORWARDED_TO_FINANCE')
+            queryset = queryset.filter(FORWARDED_Q)
         
         # Apply additional filters
         scholarship_type = self.request.query_params.get('scholarship_type')
@@ -139,7 +183,9 @@ class VerifiedApplicationsListView(generics.ListAPIView):
         if date_to:
             queryset = queryset.filter(approved_at__lte=date_to)
         
-        return queryset.distinct()
+        # Every filter follows forward FKs only, so rows can't be duplicated
+        # and SELECT DISTINCT isn't needed
+        return queryset
 
     @extend_schema(
         summary="List Verified Applications for Department Review",
@@ -154,30 +200,13 @@ class VerifiedApplicationsListView(generics.ListAPIView):
             OpenApiParameter(name='course', description='Filter by course name', required=False, type=str),
             OpenApiParameter(name='date_from', description='Filter from date (YYYY-MM-DD)', required=False, type=str),
             OpenApiParameter(name='date_to', description='Filter to date (YYYY-MM-DD)', required=False, type=str),
+            OpenApiParameter(name='fields', description='Comma-separated fields to include in each application', required=False, type=str),
         ],
         responses={200: VerifiedApplicationListSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
         try:
-            response = super().get(request, *args, **kwargs)
-            
-            # Add summary statistics
-            queryset = self.filter_queryset(self.get_queryset())
-            stats = {
-                'total_verified_applications': queryset.count(),
-                'pending_dept_review': queryset.exclude(
-                    Q(internal_notes__icontains='DEPT_APPROVED') | 
-                    Q(internal_notes__icontains='DEPT_REJECTED')
-                ).count(),
-                'dept_approved': queryset.filter(internal_notes__icontains='DEPT_APPROVED').count(),
-                'dept_rejected': queryset.filter(internal_notes__icontains='DEPT_REJECTED').count(),
-                'forwarded_to_finance': queryset.filter(internal_notes__icontains='FORWARDED_TO_FINANCE').count(),
-                'total_amount_approved': float(queryset.aggregate(Sum('amount_approved'))['amount_approved__sum'] or 0),
-                'average_amount': float(queryset.aggregate(Avg('amount_approved'))['amount_approved__avg'] or 0),
-            }
-            
-            response.data['summary'] = stats
-            return response
+            return self.list(request, *args, **kwargs)
             
         except Exception as e:
             logger.error(f"Error in VerifiedApplicationsListView: {str(e)}")
@@ -185,6 +214,52 @@ class VerifiedApplicationsListView(generics.ListAPIView):
                 {'error': 'Failed to retrieve applications', 'detail': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+    
+    def list(self, request, *args, **kwargs):
+        """Paginated applications plus summary statistics over the same filtered queryset"""
+        queryset = self.filter_queryset(self.get_queryset())
+        
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(self.get_serializer(queryset, many=True).data)
+        response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+        
+        # Add summary statistics, cached per department and filter set
+        department = get_department(request)
+        params = sorted(
+            (key, value) for key, values in request.query_params.lists()
+            if key not in PAGINATION_PARAMS for value in values
+        )
+        params_hash = hashlib.blake2b(repr(params).encode(), digest_size=8).hexdigest()
+        cache_key = (
+            f"dept:{department.id}:apps:{applications_version(department.id)}"
+            f":{params_hash}:summary"
+        )
+        response.data['summary'] = dashboard_cache().get_or_set(
+            cache_key, lambda: self._summary_stats(queryset), SUMMARY_CACHE_TIMEOUT
+        )
+        return response
+    
+    def _summary_stats(self, queryset):
+        """Summary counts and amounts over the filtered applications"""
+        totals = queryset.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=DEPT_PENDING_Q),
+            approved=Count('id', filter=DEPT_APPROVED_Q),
+            rejected=Count('id', filter=DEPT_REJECTED_Q),
+            forwarded=Count('id', filter=FORWARDED_Q),
+            total_amount=Sum('amount_approved'),
+            avg_amount=Avg('amount_approved'),
+        )
+        return {
+            'total_verified_applications': totals['total'],
+            'pending_dept_review': totals['pending'],
+            'dept_approved': totals['approved'],
+            'dept_rejected': totals['rejected'],
+            'forwarded_to_finance': totals['forwarded'],
+            'total_amount_approved': float(totals['total_amount'] or 0),
+            'average_amount': float(totals['avg_amount'] or 0),
+        }
 
 
 class ApplicationReviewView(APIView):
@@ -210,14 +285,21 @@ class ApplicationReviewView(APIView):
         try:
             # Get department for permission check
             user = request.user
-            department = user.department_admin_profile.department
+            department = get_department(request)
             
-            # Get application
-            application = get_object_or_404(
-                ScholarshipApplication.objects.select_related('student', 'student__department'),
-                application_id=application_id,
-                student__department=department
-            )
+            # Point read on the unique application_id index, no join
+            application = get_object_or_404(ScholarshipApplication, application_id=application_id)
+            
+            # Authorize against the department and load the student for the response
+            student = Student.objects.select_related('user').only(
+                'id', 'department_id', 'user__first_name', 'user__last_name'
+            ).filter(pk=application.student_id, department=department).first()
+            if student is None:
+                return Response(
+                    {'error': 'Application does not belong to your department'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            application.student = student
             
             # Validate application can be processed by department
             if application.status not in ['approved', 'partially_approved']:
@@ -227,8 +309,7 @@ class ApplicationReviewView(APIView):
                 )
             
             # Check if already processed by department
-            if (application.internal_notes and 
-                ('DEPT_APPROVED' in application.internal_notes or 'DEPT_REJECTED' in application.internal_notes)):
+            if application.dept_review_state != 'pending':
                 return Response(
                     {'error': 'Application has already been processed by department'},
                     status=status.HTTP_400_BAD_REQUEST
@@ -243,6 +324,10 @@ class ApplicationReviewView(APIView):
             internal_notes = serializer.validated_data.get('internal_notes', '')
             final_approved_amount = serializer.validated_data.get('final_approved_amount')
             
+            # Latest department action, kept in columns for the dashboard
+            application.dept_reviewed_at = timezone.now()
+            application.dept_reviewer_email = user.email
+            
             # Process the department decision
             if action == 'dept_approve':
                 # Department approves the application
@@ -257,22 +342,12 @@ class ApplicationReviewView(APIView):
                     'final_approved_amount': float(application.amount_approved),
                     'approved_by': user.email,
                     'department': department.name,
-                    'timestamp': timezone.now().isoformat()
+                    'timestamp': application.dept_reviewed_at.isoformat()
                 }
                 
-                # Update internal notes
-                if application.internal_notes:
-                    try:
-                        notes_data = json.loads(application.internal_notes)
-                        if not isinstance(notes_data, list):
-                            notes_data = [notes_data]
-                    except (json.JSONDecodeError, TypeError):
-                        notes_data = [{'old_notes': application.internal_notes}]
-                else:
-                    notes_data = []
-                
-                notes_data.append(dept_decision)
-                application.internal_notes = json.dumps(notes_data, indent=2)
+                # Append to the internal notes history in SQL
+                application.internal_notes = AppendNote('internal_notes', dept_decision)
+                application.dept_review_state = 'approved'
                 
                 # Update review comments
                 if application.review_comments:
@@ -294,27 +369,17 @@ class ApplicationReviewView(APIView):
                     'internal_notes': internal_notes,
                     'rejected_by': user.email,
                     'department': department.name,
-                    'timestamp': timezone.now().isoformat()
+                    'timestamp': application.dept_reviewed_at.isoformat()
                 }
                 
-                # Update internal notes
-                if application.internal_notes:
-                    try:
-                        notes_data = json.loads(application.internal_notes)
-                        if not isinstance(notes_data, list):
-                            notes_data = [notes_data]
-                    except (json.JSONDecodeError, TypeError):
-                        notes_data = [{'old_notes': application.internal_notes}]
-                else:
-                    notes_data = []
-                
-                notes_data.append(dept_decision)
-                application.internal_notes = json.dumps(notes_data, indent=2)
+                # Append to the internal notes history in SQL
+                application.internal_notes = AppendNote('internal_notes', dept_decision)
+                application.dept_review_state = 'rejected'
                 
                 # Update status to rejected
                 application.status = 'rejected'
                 application.rejection_reason = f"Department Rejection: {dept_remarks}"
-                application.rejected_at = timezone.now()
+                application.rejected_at = application.dept_reviewed_at
                 
                 application.save()
                 
@@ -362,7 +427,7 @@ class ForwardToFinanceView(APIView):
         """Forward applications to finance module"""
         try:
             user = request.user
-            department = user.department_admin_profile.department
+            department = get_department(request)
             
             serializer = ApplicationForwardSerializer(data=request.data)
             if not serializer.is_valid():
@@ -372,23 +437,36 @@ class ForwardToFinanceView(APIView):
             forward_remarks = serializer.validated_data.get('forward_remarks', '')
             priority = serializer.validated_data.get('priority', 'medium')
             
-            # Get applications that are department-approved
-            applications = ScholarshipApplication.objects.filter(
+            # Get applications that are department-approved, with just the
+            # columns the forward entry needs
+            applications = list(ScholarshipApplication.objects.filter(
                 application_id__in=application_ids,
                 student__department=department,
-                internal_notes__icontains='DEPT_APPROVED'
-            ).exclude(
-                internal_notes__icontains='FORWARDED_TO_FINANCE'
-            )
+                dept_review_state='approved'
+            ).select_related('student__user').only(
+                'id', 'application_id', 'amount_approved',
+                'student__student_id', 'student__course_name', 'student__academic_year',
+                'student__user__first_name', 'student__user__last_name',
+                'student__user__email', 'student__user__phone_number'
+            ))
             
-            if not applications.exists():
+            if not applications:
                 return Response(
                     {'error': 'No eligible applications found for forwarding'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            forwarded_count = 0
-            failed_applications = []
+            now = timezone.now()
+            forwarded = []
+            forwards = {}
+            # IDs the eligibility query did not return, diffed against the
+            # validated (duplicate-free) input instead of re-queried one by one
+            found = {application.application_id for application in applications}
+            failed_applications = [
+                {'application_id': application_id, 'error': 'Not found or not department-approved'}
+                for application_id in application_ids
+                if application_id not in found
+            ]
             
             for application in applications:
                 try:
@@ -399,7 +477,7 @@ class ForwardToFinanceView(APIView):
                         'priority': priority,
                         'forwarded_by': user.email,
                         'department': department.name,
-                        'forwarded_at': timezone.now().isoformat(),
+                        'forwarded_at': now.isoformat(),
                         'amount_for_disbursement': float(application.amount_approved),
                         'student_details': {
                             'student_id': application.student.student_id,
@@ -410,39 +488,43 @@ class ForwardToFinanceView(APIView):
                             'academic_year': application.student.academic_year
                         }
                     }
-                    
-                    # Update internal notes
-                    if application.internal_notes:
-                        try:
-                            notes_data = json.loads(application.internal_notes)
-                            if not isinstance(notes_data, list):
-                                notes_data = [notes_data]
-                        except (json.JSONDecodeError, TypeError):
-                            notes_data = [{'old_notes': application.internal_notes}]
-                    else:
-                        notes_data = []
-                    
-                    notes_data.append(finance_forward)
-                    application.internal_notes = json.dumps(notes_data, indent=2)
-                    
-                    # Update application status
-                    application.status = 'approved'  # Ready for finance processing
-                    application.save()
-                    
-                    # Send notification to finance module (if API exists)
-                    self._notify_finance_module(application, finance_forward)
-                    
-                    forwarded_count += 1
-                    
                 except Exception as e:
                     failed_applications.append({
                         'application_id': application.application_id,
                         'error': str(e)
                     })
+                    continue
+                
+                # Append to the internal notes history in SQL
+                application.internal_notes = AppendNote('internal_notes', finance_forward)
+                application.dept_review_state = 'forwarded'
+                application.dept_reviewed_at = now
+                application.dept_reviewer_email = user.email
+                application.status = 'approved'  # Ready for finance processing
+                application.updated_at = now  # bulk_update skips auto_now
+                forwarded.append(application)
+                forwards[application.application_id] = finance_forward
+            
+            # One UPDATE per batch instead of one per application
+            ScholarshipApplication.objects.bulk_update(
+                forwarded,
+                [
+                    'internal_notes', 'dept_review_state', 'dept_reviewed_at',
+                    'dept_reviewer_email', 'status', 'updated_at'
+                ],
+                batch_size=500
+            )
+            forwarded_count = len(forwarded)
             
-            # Send email notification to finance team
             if forwarded_count > 0:
-                self._send_finance_notification_email(department, forwarded_count, user)
+                # bulk_update sends no post_save, so invalidate cached data here
+                transaction.on_commit(lambda: bump_applications_version(department.id))
+                # Notify the finance module (if API exists) off the request path
+                transaction.on_commit(lambda: notify_finance_module.delay(forwards))
+                # Email the finance team once the forward is committed
+                transaction.on_commit(
+                    lambda: send_finance_email.delay(department.id, forwarded_count, user.id)
+                )
             
             return Response({
                 'message': f'Successfully forwarded {forwarded_count} applications to finance module',
@@ -457,55 +539,6 @@ class ForwardToFinanceView(APIView):
                 {'error': 'Failed to forward applications', 'detail': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-    
-    def _notify_finance_module(self, application, finance_forward):
-        """Send notification to finance module API"""
-        try:
-            # This would integrate with the finance module API
-            # For now, we'll log the notification
-            logger.info(f"Finance notification: Application {application.application_id} forwarded for disbursement")
-            
-            # Future implementation could make HTTP request to finance API
-            # finance_api_url = settings.FINANCE_MODULE_API_URL
-            # if finance_api_url:
-            #     requests.post(f"{finance_api_url}/notifications/", json=finance_forward)
-            
-        except Exception as e:
-            logger.warning(f"Failed to notify finance module: {str(e)}")
-    
-    def _send_finance_notification_email(self, department, count, user):
-        """Send email notification to finance team"""
-        try:
-            subject = f"New Applications Forwarded from {department.name}"
-            message = f"""
-            Dear Finance Team,
-            
-            {count} scholarship applications have been forwarded from {department.name} department 
-            for disbursement processing.
-            
-            Forwarded by: {user.get_full_name()} ({user.email})
-            Department: {department.name}
-            Date: {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}
-            
-            Please log into the finance portal to review and process these applications.
-            
-            Best regards,
-            Scholarship Portal System
-            """
-            
-            # Send email to finance team
-            finance_emails = getattr(settings, 'FINANCE_TEAM_EMAILS', [])
-            if finance_emails:
-                send_mail(
-                    subject,
-                    message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    finance_emails,
-                    fail_silently=True
-                )
-                
-        except Exception as e:
-            logger.warning(f"Failed to send finance notification email: {str(e)}")
 
 
 class DepartmentDashboardView(APIView):
@@ -521,21 +554,14 @@ class DepartmentDashboardView(APIView):
     )
     def get(self, request):
         try:
-            user = request.user
-            department = user.department_admin_profile.department
+            department = get_department(request)
             
-            # Get cached dashboard data
-            cache_key = f"dept_dashboard_{department.id}"
-            cached_data = cache.get(cache_key)
-            
-            if cached_data:
-                return Response(cached_data, status=status.HTTP_200_OK)
-            
-            # Generate dashboard data
-            dashboard_data = self._generate_dashboard_data(department)
-            
-            # Cache for 15 minutes
-            cache.set(cache_key, dashboard_data, 900)
+            # Cached dashboard data; the key moves on after any application write
+            cache_key = f"dept:{department.id}:dash:{applications_version(department.id)}"
+            now = timezone.now()
+            dashboard_data = dashboard_cache().get_or_set(
+                cache_key, lambda: self._generate_dashboard_data(department, now), DASHBOARD_CACHE_TIMEOUT
+            )
             
             return Response(dashboard_data, status=status.HTTP_200_OK)
             
@@ -546,7 +572,7 @@ class DepartmentDashboardView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
-    def _generate_dashboard_data(self, department):
+    def _generate_dashboard_data(self, department, now):
         """Generate comprehensive dashboard data"""
         
         # Base application queryset
@@ -555,102 +581,77 @@ class DepartmentDashboardView(APIView):
         # Students in department
         students = Student.objects.filter(department=department)
         
-        # Key metrics
-        total_students = students.count()
-        active_students = students.filter(is_active=True).count()
-        verified_students = students.filter(is_verified=True).count()
-        
-        # Application metrics
-        total_applications = applications.count()
-        institute_approved = applications.filter(status__in=['approved', 'partially_approved']).count()
-        
-        # Department review status
-        dept_approved = applications.filter(internal_notes__icontains='DEPT_APPROVED').count()
-        dept_rejected = applications.filter(internal_notes__icontains='DEPT_REJECTED').count()
-        forwarded_to_finance = applications.filter(internal_notes__icontains='FORWARDED_TO_FINANCE').count()
-        
-        # Pending department review
-        pending_dept_review = applications.filter(
-            status__in=['approved', 'partially_approved']
-        ).exclude(
-            Q(internal_notes__icontains='DEPT_APPROVED') | 
-            Q(internal_notes__icontains='DEPT_REJECTED')
-        ).count()
+        # Key metrics, one aggregate per table
+        student_stats = students.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            verified=Count('id', filter=Q(is_verified=True)),
+        )
+        total_students = student_stats['total']
+        active_students = student_stats['active']
+        verified_students = student_stats['verified']
         
-        # Financial metrics
-        total_requested = applications.aggregate(Sum('amount_requested'))['amount_requested__sum'] or 0
-        total_approved = applications.filter(
-            internal_notes__icontains='DEPT_APPROVED'
-        ).aggregate(Sum('amount_approved'))['amount_approved__sum'] or 0
+        pending_dept_q = INSTITUTE_APPROVED_Q & DEPT_PENDING_Q
+        app_stats = applications.aggregate(
+            total=Count('id'),
+            institute_approved=Count('id', filter=INSTITUTE_APPROVED_Q),
+            # Department review status
+            dept_approved=Count('id', filter=DEPT_APPROVED_Q),
+            dept_rejected=Count('id', filter=DEPT_REJECTED_Q),
+            forwarded=Count('id', filter=FORWARDED_Q),
+            pending_dept=Count('id', filter=pending_dept_q),
+            # Financial metrics
+            total_requested=Sum('amount_requested'),
+            total_approved=Sum('amount_approved', filter=DEPT_APPROVED_Q),
+            # Alerts
+            high_priority_pending=Count('id', filter=pending_dept_q & Q(priority='high')),
+            urgent_priority_pending=Count('id', filter=pending_dept_q & Q(priority='urgent')),
+            overdue_reviews=Count('id', filter=pending_dept_q & Q(
+                approved_at__lte=now - OVERDUE_REVIEW_AGE
+            )),
+        )
+        total_applications = app_stats['total']
+        institute_approved = app_stats['institute_approved']
+        dept_approved = app_stats['dept_approved']
+        dept_rejected = app_stats['dept_rejected']
+        forwarded_to_finance = app_stats['forwarded']
+        pending_dept_review = app_stats['pending_dept']
+        total_requested = app_stats['total_requested'] or 0
+        total_approved = app_stats['total_approved'] or 0
         
-        # Course-wise breakdown
-        course_breakdown = applications.values('student__course_name').annotate(
-            count=Count('id'),
-            approved_count=Count('id', filter=Q(internal_notes__icontains='DEPT_APPROVED')),
-            total_amount=Sum('amount_approved')
-        ).order_by('-count')[:5]
+        # Course, scholarship type, priority and monthly (last 6 months)
+        # breakdowns, all folded from one grouped query
+        first_month = timezone.localtime(now).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        ) - relativedelta(months=5)
+        course_breakdown, scholarship_types, priority_distribution, monthly_totals = (
+            self._application_breakdowns(applications, first_month)
+        )
         
-        # Monthly trends (last 6 months)
         monthly_trends = []
         for i in range(6):
-            month_start = (timezone.now().replace(day=1) - timedelta(days=30*i))
-            month_end = month_start + timedelta(days=32)
-            month_end = month_end.replace(day=1) - timedelta(days=1)
-            
-            month_apps = applications.filter(
-                submitted_at__gte=month_start,
-                submitted_at__lte=month_end
-            )
-            
-            monthly_trends.append({
-                'month': month_start.strftime('%Y-%m'),
-                'total_applications': month_apps.count(),
-                'dept_approved': month_apps.filter(internal_notes__icontains='DEPT_APPROVED').count(),
-                'forwarded_to_finance': month_apps.filter(internal_notes__icontains='FORWARDED_TO_FINANCE').count(),
-                'total_amount': float(month_apps.aggregate(Sum('amount_approved'))['amount_approved__sum'] or 0)
-            })
+            month = (first_month + relativedelta(months=i)).strftime('%Y-%m')
+            monthly_trends.append({'month': month, **monthly_totals[month]})
         
-        # Scholarship type distribution
-        scholarship_types = applications.values('scholarship_type').annotate(
-            count=Count('id'),
-            dept_approved_count=Count('id', filter=Q(internal_notes__icontains='DEPT_APPROVED')),
-            total_amount=Sum('amount_approved')
-        ).order_by('-count')
-        
-        # Priority distribution for pending applications
-        priority_distribution = applications.filter(
-            status__in=['approved', 'partially_approved']
-        ).exclude(
-            Q(internal_notes__icontains='DEPT_APPROVED') | 
-            Q(internal_notes__icontains='DEPT_REJECTED')
-        ).values('priority').annotate(count=Count('id')).order_by('-count')
+        # Recent activities (last 10 department actions), read from the
+        # review columns rather than parsed out of internal_notes
+        recent_apps = applications.exclude(
+            dept_review_state='pending'
+        ).select_related('student__user').only(
+            'application_id', 'amount_approved', 'dept_review_state', 'dept_reviewed_at',
+            'student__user__first_name', 'student__user__last_name'
+        ).order_by('-dept_reviewed_at')[:10]
         
-        # Recent activities (last 10 department actions)
-        recent_activities = []
-        recent_apps = applications.filter(
-            Q(internal_notes__icontains='DEPT_APPROVED') | 
-            Q(internal_notes__icontains='DEPT_REJECTED') |
-            Q(internal_notes__icontains='FORWARDED_TO_FINANCE')
-        ).order_by('-updated_at')[:10]
-        
-        for app in recent_apps:
-            if app.internal_notes:
-                try:
-                    notes_data = json.loads(app.internal_notes)
-                    if isinstance(notes_data, list):
-                        for note in reversed(notes_data):
-                            if isinstance(note, dict) and 'action' in note:
-                                if note['action'] in ['DEPT_APPROVED', 'DEPT_REJECTED', 'FORWARDED_TO_FINANCE']:
-                                    recent_activities.append({
-                                        'application_id': app.application_id,
-                                        'student_name': app.student.user.get_full_name(),
-                                        'action': note['action'],
-                                        'timestamp': note.get('timestamp'),
-                                        'amount': float(app.amount_approved or 0)
-                                    })
-                                    break
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        recent_activities = [
+            {
+                'application_id': app.application_id,
+                'student_name': app.student.user.get_full_name(),
+                'action': DEPT_STATE_ACTIONS[app.dept_review_state],
+                'timestamp': API_DATETIME.to_representation(app.dept_reviewed_at) if app.dept_reviewed_at else None,
+                'amount': float(app.amount_approved or 0)
+            }
+            for app in recent_apps
+        ]
         
         # Performance metrics
         avg_processing_time = self._calculate_avg_dept_processing_time(applications)
@@ -658,7 +659,7 @@ class DepartmentDashboardView(APIView):
         return {
             'department_name': department.name,
             'department_code': department.code,
-            'generated_at': timezone.now(),
+            'generated_at': API_DATETIME.to_representation(now),
             
             # Key metrics
             'key_metrics': {
@@ -680,52 +681,96 @@ class DepartmentDashboardView(APIView):
             
             # Charts and analytics
             'charts': {
-                'course_breakdown': list(course_breakdown),
-                'monthly_trends': list(reversed(monthly_trends)),
-                'scholarship_types': list(scholarship_types),
-                'priority_distribution': list(priority_distribution)
+                'course_breakdown': course_breakdown,
+                'monthly_trends': monthly_trends,
+                'scholarship_types': scholarship_types,
+                'priority_distribution': priority_distribution
             },
             
             # Recent activities
-            'recent_activities': recent_activities[:10],
+            'recent_activities': recent_activities,
             
             # Alerts and notifications
             'alerts': {
                 'pending_review_count': pending_dept_review,
-                'high_priority_pending': applications.filter(
-                    priority='high',
-                    status__in=['approved', 'partially_approved']
-                ).exclude(
-                    Q(internal_notes__icontains='DEPT_APPROVED') | 
-                    Q(internal_notes__icontains='DEPT_REJECTED')
-                ).count(),
-                'urgent_priority_pending': applications.filter(
-                    priority='urgent',
-                    status__in=['approved', 'partially_approved']
-                ).exclude(
-                    Q(internal_notes__icontains='DEPT_APPROVED') | 
-                    Q(internal_notes__icontains='DEPT_REJECTED')
-                ).count(),
-                'overdue_reviews': self._get_overdue_reviews_count(applications)
+                'high_priority_pending': app_stats['high_priority_pending'],
+                'urgent_priority_pending': app_stats['urgent_priority_pending'],
+                'overdue_reviews': app_stats['overdue_reviews']
             }
         }
     
+    def _application_breakdowns(self, applications, first_month):
+        """Fold one grouped rollup into course, scholarship type, priority and monthly breakdowns"""
+        # Submission month from first_month on; older applications share one NULL group.
+        # Month boundaries are built in local time here and compared as plain
+        # datetimes, so MySQL needs no CONVERT_TZ (and no time zone tables)
+        month_starts = [first_month + relativedelta(months=i) for i in range(7)]
+        recent_month = Case(
+            *[
+                When(submitted_at__gte=start, submitted_at__lt=end, then=Value(start.strftime('%Y-%m')))
+                for start, end in zip(month_starts, month_starts[1:])
+            ],
+            default=None,
+            output_field=CharField()
+        )
+        rollup = applications.values(
+            'student__course_name', 'scholarship_type', 'priority', 'status', 'dept_review_state',
+            month=recent_month
+        ).annotate(
+            count=Count('id'),
+            total_amount=Sum(AsFloat('amount_approved'))
+        ).order_by()
+        
+        courses = defaultdict(lambda: {'count': 0, 'approved_count': 0, 'total_amount': None})
+        types = defaultdict(lambda: {'count': 0, 'dept_approved_count': 0, 'total_amount': None})
+        priorities = defaultdict(int)
+        months = defaultdict(lambda: {
+            'total_applications': 0, 'dept_approved': 0, 'forwarded_to_finance': 0, 'total_amount': 0.0
+        })
+        
+        for row in rollup:
+            dept_approved = row['dept_review_state'] in DEPT_APPROVED_STATES
+            for bucket, approved_key in (
+                (courses[row['student__course_name']], 'approved_count'),
+                (types[row['scholarship_type']], 'dept_approved_count'),
+            ):
+                bucket['count'] += row['count']
+                if dept_approved:
+                    bucket[approved_key] += row['count']
+                if row['total_amount'] is not None:
+                    bucket['total_amount'] = (bucket['total_amount'] or 0.0) + row['total_amount']
+            
+            if row['status'] in ('approved', 'partially_approved') and row['dept_review_state'] == 'pending':
+                priorities[row['priority']] += row['count']
+            
+            if row['month'] is not None:
+                month = months[row['month']]
+                month['total_applications'] += row['count']
+                if dept_approved:
+                    month['dept_approved'] += row['count']
+                if row['dept_review_state'] == 'forwarded':
+                    month['forwarded_to_finance'] += row['count']
+                month['total_amount'] += row['total_amount'] or 0.0
+        
+        course_breakdown = sorted(
+            ({'student__course_name': name, **totals} for name, totals in courses.items()),
+            key=lambda item: item['count'], reverse=True
+        )[:5]
+        scholarship_types = sorted(
+            ({'scholarship_type': name, **totals} for name, totals in types.items()),
+            key=lambda item: item['count'], reverse=True
+        )
+        priority_distribution = sorted(
+            ({'priority': priority, 'count': count} for priority, count in priorities.items()),
+            key=lambda item: item['count'], reverse=True
+        )
+        return course_breakdown, scholarship_types, priority_distribution, months
+    
     def _calculate_avg_dept_processing_time(self, applications):
         """Calculate average department processing time"""
         # This would need more detailed tracking of department review times
         # For now, return a placeholder
         return 2.5  # Average days
-    
-    def _get_overdue_reviews_count(self, applications):
-        """Get count of overdue department reviews (>7 days)"""
-        seven_days_ago = timezone.now() - timedelta(days=7)
-        return applications.filter(
-            approved_at__lte=seven_days_ago,
-            status__in=['approved', 'partially_approved']
-        ).exclude(
-            Q(internal_notes__icontains='DEPT_APPROVED') | 
-            Q(internal_notes__icontains='DEPT_REJECTED')
-        ).count()
 
 
 class DepartmentReportsView(APIView):
@@ -749,8 +794,7 @@ class DepartmentReportsView(APIView):
     def get(self, request):
         """Generate and return reports"""
         try:
-            user = request.user
-            department = user.department_admin_profile.department
+            department = get_department(request)
             
             # Get report parameters
             report_type = request.query_params.get('report_type', 'summary')
@@ -767,6 +811,9 @@ class DepartmentReportsView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
+            # One timestamp for the whole report
+            now = timezone.now()
+            
             # Build base queryset
             queryset = ScholarshipApplication.objects.filter(student__department=department)
             
@@ -780,26 +827,30 @@ class DepartmentReportsView(APIView):
             if course_filter:
                 queryset = queryset.filter(student__course_name__icontains=course_filter)
             
+            # CSV exports are streamed straight from the database
+            if format_type == 'csv':
+                return self._export_csv(queryset, report_type, now)
+            
             # Generate report based on type
             if report_type == 'summary':
-                report_data = self._generate_summary_report(queryset, department)
+                report_data = self._generate_summary_report(queryset, department, now)
             elif report_type == 'detailed':
-                report_data = self._generate_detailed_report(queryset, department)
+                report_data = self._generate_detailed_report(queryset, department, now)
             elif report_type == 'financial':
-                report_data = self._generate_financial_report(queryset, department)
+                report_data = self._generate_financial_report(queryset, department, now)
             elif report_type == 'performance':
-                report_data = self._generate_performance_report(queryset, department)
+                report_data = self._generate_performance_report(queryset, department, now)
             elif report_type == 'course_wise':
-                report_data = self._generate_course_wise_report(queryset, department)
+                report_data = self._generate_course_wise_report(queryset, department, now)
             elif report_type == 'forwarded_tracking':
-                report_data = self._generate_forwarded_tracking_report(queryset, department)
+                report_data = self._generate_forwarded_tracking_report(queryset, department, now)
             
-            # Return data in requested format
-            if format_type == 'csv':
-                return self._export_csv(report_data, report_type)
-            else:
-                serializer = DepartmentReportSerializer(report_data)
-                return Response(serializer.data, status=status.HTTP_200_OK)
+            passthrough = {
+                key: report_data.pop(key) for key in REPORT_PASSTHROUGH_FIELDS if key in report_data
+            }
+            response_data = DepartmentReportSerializer(report_data).data
+            response_data.update(passthrough)
+            return Response(response_data, status=status.HTTP_200_OK)
                 
         except Exception as e:
             logger.error(f"Error in DepartmentReportsView: {str(e)}")
@@ -808,30 +859,29 @@ class DepartmentReportsView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
-    def _generate_summary_report(self, queryset, department):
+    def _generate_summary_report(self, queryset, department, now):
         """Generate summary report"""
-        total_applications = queryset.count()
-        
-        # Department review status
-        dept_approved = queryset.filter(internal_notes__icontains='DEPT_APPROVED').count()
-        dept_rejected = queryset.filter(internal_notes__icontains='DEPT_REJECTED').count()
-        forwarded_to_finance = queryset.filter(internal_notes__icontains='FORWARDED_TO_FINANCE').count()
-        pending_review = queryset.filter(
-            status__in=['approved', 'partially_approved']
-        ).exclude(
-            Q(internal_notes__icontains='DEPT_APPROVED') | 
-            Q(internal_notes__icontains='DEPT_REJECTED')
-        ).count()
-        
-        # Financial summary
-        total_approved_amount = queryset.filter(
-            internal_notes__icontains='DEPT_APPROVED'
-        ).aggregate(Sum('amount_approved'))['amount_approved__sum'] or 0
+        totals = queryset.aggregate(
+            total=Count('id'),
+            # Department review status
+            dept_approved=Count('id', filter=DEPT_APPROVED_Q),
+            dept_rejected=Count('id', filter=DEPT_REJECTED_Q),
+            forwarded=Count('id', filter=FORWARDED_Q),
+            pending_review=Count('id', filter=INSTITUTE_APPROVED_Q & DEPT_PENDING_Q),
+            # Financial summary
+            total_approved_amount=Sum('amount_approved', filter=DEPT_APPROVED_Q),
+        )
+        total_applications = totals['total']
+        dept_approved = totals['dept_approved']
+        dept_rejected = totals['dept_rejected']
+        forwarded_to_finance = totals['forwarded']
+        pending_review = totals['pending_review']
+        total_approved_amount = totals['total_approved_amount'] or 0
         
         return {
             'report_type': 'summary',
             'department': department.name,
-            'generated_at': timezone.now(),
+            'generated_at': now,
             'total_applications': total_applications,
             'dept_approved': dept_approved,
             'dept_rejected': dept_rejected,
@@ -842,188 +892,206 @@ class DepartmentReportsView(APIView):
             'average_approved_amount': float(total_approved_amount / dept_approved) if dept_approved > 0 else 0
         }
     
-    def _generate_detailed_report(self, queryset, department):
+    def _generate_detailed_report(self, queryset, department, now):
         """Generate detailed applications report"""
         applications_data = []
         
-        for app in queryset.select_related('student', 'student__user'):
-            # Determine department status
-            dept_status = 'pending_review'
-            if app.internal_notes:
-                if 'DEPT_APPROVED' in app.internal_notes:
-                    dept_status = 'dept_approved'
-                elif 'DEPT_REJECTED' in app.internal_notes:
-                    dept_status = 'dept_rejected'
-                if 'FORWARDED_TO_FINANCE' in app.internal_notes:
-                    dept_status = 'forwarded_to_finance'
-            
+        # Plain dicts of only the columns the report reads, fetched in chunks
+        applications = queryset.values(
+            'application_id', 'student__student_id',
+            'student__user__first_name', 'student__user__last_name',
+            'student__course_name', 'student__academic_year', 'scholarship_type',
+            'status', 'priority', 'submitted_at', 'approved_at',
+            amount_requested_value=AsFloat('amount_requested'),
+            amount_approved_value=Coalesce(AsFloat('amount_approved'), 0.0),
+            dept_status=DEPT_STATUS_LABEL
+        ).iterator(chunk_size=2000)
+        
+        for app in applications:
             applications_data.append({
-                'application_id': app.application_id,
-                'student_id': app.student.student_id,
-                'student_name': app.student.user.get_full_name(),
-                'course': app.student.course_name,
-                'academic_year': app.student.academic_year,
-                'scholarship_type': app.scholarship_type,
-                'amount_requested': float(app.amount_requested),
-                'amount_approved': float(app.amount_approved or 0),
-                'institute_status': app.status,
-                'dept_status': dept_status,
-                'priority': app.priority,
-                'submitted_at': app.submitted_at,
-                'approved_at': app.approved_at
+                'application_id': app['application_id'],
+                'student_id': app['student__student_id'],
+                'student_name': f"{app['student__user__first_name']} {app['student__user__last_name']}".strip(),
+                'course': app['student__course_name'],
+                'academic_year': app['student__academic_year'],
+                'scholarship_type': app['scholarship_type'],
+                'amount_requested': app['amount_requested_value'],
+                'amount_approved': app['amount_approved_value'],
+                'institute_status': app['status'],
+                'dept_status': app['dept_status'],
+                'priority': app['priority'],
+                'submitted_at': app['submitted_at'],
+                'approved_at': app['approved_at']
             })
         
         return {
             'report_type': 'detailed',
             'department': department.name,
-            'generated_at': timezone.now(),
+            'generated_at': now,
             'total_records': len(applications_data),
             'applications': applications_data
         }
     
-    def _generate_financial_report(self, queryset, department):
+    def _generate_financial_report(self, queryset, department, now):
         """Generate financial analysis report"""
-        financial_data = {
-            'total_requested': float(queryset.aggregate(Sum('amount_requested'))['amount_requested__sum'] or 0),
-            'total_approved_by_dept': float(queryset.filter(
-                internal_notes__icontains='DEPT_APPROVED'
-            ).aggregate(Sum('amount_approved'))['amount_approved__sum'] or 0),
-            'total_forwarded': float(queryset.filter(
-                internal_notes__icontains='FORWARDED_TO_FINANCE'
-            ).aggregate(Sum('amount_approved'))['amount_approved__sum'] or 0)
-        }
+        totals = queryset.aggregate(
+            total_requested=Sum('amount_requested'),
+            total_approved_by_dept=Sum('amount_approved', filter=DEPT_APPROVED_Q),
+            total_forwarded=Sum('amount_approved', filter=FORWARDED_Q),
+        )
+        financial_data = {key: float(value or 0) for key, value in totals.items()}
         
-        # Amount ranges analysis
-        range_analysis = []
+        # Amount ranges analysis, all buckets counted in one scan
         amount_ranges = [
             {'range': '0-25000', 'min': 0, 'max': 25000},
             {'range': '25001-50000', 'min': 25001, 'max': 50000},
             {'range': '50001-100000', 'min': 50001, 'max': 100000},
-            {'range': '100000+', 'min': 100001, 'max': float('inf')}
+            {'range': '100000+', 'min': 100001, 'max': None}
         ]
         
-        for range_data in amount_ranges:
-            if range_data['max'] == float('inf'):
-                count = queryset.filter(amount_approved__gte=range_data['min']).count()
-                total = queryset.filter(amount_approved__gte=range_data['min']).aggregate(
-                    Sum('amount_approved'))['amount_approved__sum'] or 0
-            else:
-                count = queryset.filter(
-                    amount_approved__gte=range_data['min'],
-                    amount_approved__lte=range_data['max']
-                ).count()
-                total = queryset.filter(
-                    amount_approved__gte=range_data['min'],
-                    amount_approved__lte=range_data['max']
-                ).aggregate(Sum('amount_approved'))['amount_approved__sum'] or 0
-            
-            range_analysis.append({
+        bucket_aggregates = {}
+        for index, range_data in enumerate(amount_ranges):
+            range_q = Q(amount_approved__gte=range_data['min'])
+            if range_data['max'] is not None:
+                range_q &= Q(amount_approved__lte=range_data['max'])
+            bucket_aggregates[f'count_{index}'] = Count('id', filter=range_q)
+            bucket_aggregates[f'sum_{index}'] = Sum('amount_approved', filter=range_q)
+        buckets = queryset.aggregate(**bucket_aggregates)
+        
+        range_analysis = [
+            {
                 'range': range_data['range'],
-                'count': count,
-                'total_amount': float(total)
-            })
+                'count': buckets[f'count_{index}'],
+                'total_amount': float(buckets[f'sum_{index}'] or 0)
+            }
+            for index, range_data in enumerate(amount_ranges)
+        ]
         
         return {
             'report_type': 'financial',
             'department': department.name,
-            'generated_at': timezone.now(),
+            'generated_at': now,
             'financial_summary': financial_data,
             'amount_range_analysis': range_analysis
         }
     
-    def _generate_performance_report(self, queryset, department):
+    def _generate_performance_report(self, queryset, department, now):
         """Generate performance metrics report"""
-        total_apps = queryset.count()
-        dept_processed = queryset.filter(
-            Q(internal_notes__icontains='DEPT_APPROVED') | 
-            Q(internal_notes__icontains='DEPT_REJECTED')
-        ).count()
+        totals = queryset.aggregate(
+            total=Count('id'),
+            processed=Count('id', filter=~DEPT_PENDING_Q),
+        )
+        total_apps = totals['total']
+        dept_processed = totals['processed']
         
         return {
             'report_type': 'performance',
             'department': department.name,
-            'generated_at': timezone.now(),
+            'generated_at': now,
             'processing_efficiency': (dept_processed / total_apps * 100) if total_apps > 0 else 0,
             'total_processed': dept_processed,
             'pending_processing': total_apps - dept_processed,
             'avg_processing_time': 2.5  # Placeholder
         }
     
-    def _generate_course_wise_report(self, queryset, department):
+    def _generate_course_wise_report(self, queryset, department, now):
         """Generate course-wise analysis report"""
         course_data = queryset.values('student__course_name').annotate(
             total_applications=Count('id'),
-            dept_approved=Count('id', filter=Q(internal_notes__icontains='DEPT_APPROVED')),
-            dept_rejected=Count('id', filter=Q(internal_notes__icontains='DEPT_REJECTED')),
-            forwarded_to_finance=Count('id', filter=Q(internal_notes__icontains='FORWARDED_TO_FINANCE')),
+            dept_approved=Count('id', filter=DEPT_APPROVED_Q),
+            dept_rejected=Count('id', filter=DEPT_REJECTED_Q),
+            forwarded_to_finance=Count('id', filter=FORWARDED_Q),
             total_amount_approved=Sum('amount_approved')
         ).order_by('-total_applications')
         
         return {
             'report_type': 'course_wise',
             'department': department.name,
-            'generated_at': timezone.now(),
+            'generated_at': now,
             'course_analysis': list(course_data)
         }
     
-    def _generate_forwarded_tracking_report(self, queryset, department):
+    def _generate_forwarded_tracking_report(self, queryset, department, now):
         """Generate forwarded applications tracking report"""
-        forwarded_apps = queryset.filter(internal_notes__icontains='FORWARDED_TO_FINANCE')
+        # The forward entry is pulled out of internal_notes by the database
+        forwarded_apps = queryset.filter(FORWARDED_Q).select_related('student__user').only(
+            'application_id', 'amount_approved',
+            'student__user__first_name', 'student__user__last_name'
+        ).annotate(
+            forward_note=NoteForAction('internal_notes', 'FORWARDED_TO_FINANCE')
+        )
         
         tracking_data = []
         for app in forwarded_apps:
-            if app.internal_notes:
-                try:
-                    notes_data = json.loads(app.internal_notes)
-                    if isinstance(notes_data, list):
-                        for note in notes_data:
-                            if isinstance(note, dict) and note.get('action') == 'FORWARDED_TO_FINANCE':
-                                tracking_data.append({
-                                    'application_id': app.application_id,
-                                    'student_name': app.student.user.get_full_name(),
-                                    'amount': float(app.amount_approved),
-                                    'forwarded_at': note.get('forwarded_at'),
-                                    'priority': note.get('priority'),
-                                    'forwarded_by': note.get('forwarded_by')
-                                })
-                                break
-                except (json.JSONDecodeError, TypeError):
-                    pass
+            note = app.forward_note
+            if not isinstance(note, dict):
+                continue
+            tracking_data.append({
+                'application_id': app.application_id,
+                'student_name': app.student.user.get_full_name(),
+                'amount': float(app.amount_approved),
+                'forwarded_at': note.get('forwarded_at'),
+                'priority': note.get('priority'),
+                'forwarded_by': note.get('forwarded_by')
+            })
         
         return {
             'report_type': 'forwarded_tracking',
             'department': department.name,
-            'generated_at': timezone.now(),
+            'generated_at': now,
             'total_forwarded': len(tracking_data),
             'forwarded_applications': tracking_data
         }
     
-    def _export_csv(self, report_data, report_type):
-        """Export report as CSV"""
-        output = io.StringIO()
-        writer = csv.writer(output)
+    def _export_csv(self, queryset, report_type, now):
+        """Export report as CSV, streamed row by row"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
         
-        if report_type == 'detailed' and 'applications' in report_data:
+        def flush():
+            value = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return value
+        
+        def rows():
+            if report_type != 'detailed':
+                return
+            
             # Headers
-            headers = [
+            writer.writerow([
                 'Application ID', 'Student ID', 'Student Name', 'Course',
                 'Academic Year', 'Scholarship Type', 'Amount Requested',
                 'Amount Approved', 'Institute Status', 'Department Status',
                 'Priority', 'Submitted At'
-            ]
-            writer.writerow(headers)
+            ])
+            yield flush()
+            
+            # Data, as plain tuples fetched in chunks without the queryset result cache
+            records = queryset.values_list(
+                'application_id', 'student__student_id',
+                'student__user__first_name', 'student__user__last_name',
+                'student__course_name', 'student__academic_year', 'scholarship_type',
+                AsFloat('amount_requested'), Coalesce(AsFloat('amount_approved'), 0.0),
+                'status', DEPT_STATUS_LABEL,
+                'priority', 'submitted_at'
+            ).iterator(chunk_size=CSV_BATCH_SIZE)
             
-            # Data
-            for app in report_data['applications']:
-                writer.writerow([
-                    app['application_id'], app['student_id'], app['student_name'],
-                    app['course'], app['academic_year'], app['scholarship_type'],
-                    app['amount_requested'], app['amount_approved'],
-                    app['institute_status'], app['dept_status'],
-                    app['priority'], app['submitted_at']
-                ])
+            # Format each fetched chunk with one writerows() call and send it as one piece
+            while batch := list(islice(records, CSV_BATCH_SIZE)):
+                writer.writerows(
+                    (application_id, student_id, f"{first_name} {last_name}".strip(),
+                     course, academic_year, scholarship_type,
+                     amount_requested, amount_approved,
+                     institute_status, dept_status,
+                     priority, submitted_at)
+                    for (application_id, student_id, first_name, last_name, course, academic_year,
+                         scholarship_type, amount_requested, amount_approved, institute_status,
+                         dept_status, priority, submitted_at) in batch
+                )
+                yield flush()
         
         # Create HTTP response
-        response = HttpResponse(output.getvalue(), content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="dept_{report_type}_report_{timezone.now().strftime("%Y%m%d")}.csv"'
+        response = StreamingHttpResponse(rows(), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="dept_{report_type}_report_{now.strftime("%Y%m%d")}.csv"'
         return response
@@ -4,20 +4,170 @@ Comprehensive serializers for Department administration
 """
 
 from rest_framework import serializers
+from rest_framework.fields import is_simple_callable
 from django.contrib.auth import get_user_model
-from django.db.models import Sum, Count, Avg
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, F, Case, When, Value, IntegerField, OuterRef, Prefetch, Subquery, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.db.models.lookups import GreaterThanOrEqual
 from django.utils import timezone
-import json
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
 
 from .models import Department, DepartmentAdmin, Course, Subject, Faculty
-from students.models import Student, ScholarshipApplication, StudentDocument
-from institutes.models import Institute
+from students.models import Student, ScholarshipApplication
 from authentication.models import CustomUser
+from authentication.serializers import CachedFieldsMixin
 
 User = get_user_model()
 
+# Department status labels reported for each dept_review_state
+DEPT_STATUS_LABELS = {
+    'pending': 'pending_review',
+    'approved': 'dept_approved',
+    'rejected': 'dept_rejected',
+    'forwarded': 'forwarded_to_finance',
+}
+
+# processing_priority score: a base per application priority, plus a bump once
+# institute approval is older than the given days and one for large amounts
+PRIORITY_SCORES = {'urgent': 4, 'high': 3, 'medium': 2, 'low': 1}
+DEFAULT_PRIORITY_SCORE = 2
+APPROVAL_AGE_BUMPS = ((7, 2), (3, 1))
+LARGE_AMOUNT_THRESHOLD = 75000
+# Minimum score for each processing_priority label, highest first; below is 'low'
+PROCESSING_PRIORITY_THRESHOLDS = ((6, 'urgent'), (4, 'high'), (2, 'medium'))
+
+# Related rows shown per department in DepartmentDetailSerializer
+DETAIL_COURSES_LIMIT = 5
+DETAIL_RECENT_APPLICATIONS_LIMIT = 5
+
+
+def _active_count(model):
+    """Correlated COUNT of a department's active rows of `model`, for annotations"""
+    return Coalesce(
+        Subquery(
+            model.objects.filter(department=OuterRef('pk'), is_active=True)
+            .order_by().values('department').annotate(count=Count('pk')).values('count'),
+            output_field=IntegerField()
+        ),
+        0
+    )
+
+
+def _full_name(first_name, last_name):
+    """User.get_full_name() for a values() row"""
+    return f"{first_name} {last_name}".strip()
+
+
+def processing_priority_label(now):
+    """processing_priority computed by the database, for queryset annotations"""
+    score = (
+        Case(
+            *[When(priority=priority, then=Value(points)) for priority, points in PRIORITY_SCORES.items()],
+            default=Value(DEFAULT_PRIORITY_SCORE),
+            output_field=IntegerField()
+        )
+        + Case(
+            # (now - approved_at).days > days, i.e. at least days + 1 whole days
+            *[When(approved_at__lte=now - timedelta(days=days + 1), then=Value(bump))
+              for days, bump in APPROVAL_AGE_BUMPS],
+            default=Value(0),
+            output_field=IntegerField()
+        )
+        + Case(
+            When(amount_approved__gt=LARGE_AMOUNT_THRESHOLD, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField()
+        )
+    )
+    return Case(
+        *[When(GreaterThanOrEqual(score, minimum), then=Value(label))
+          for minimum, label in PROCESSING_PRIORITY_THRESHOLDS],
+        default=Value('low')
+    )
+
+
+def _attribute_plan(instance, attrs):
+    """Resolve attrs on instance, noting which steps are callables; returns (plan, value)"""
+    plan = []
+    for attr in attrs:
+        instance = getattr(instance, attr)
+        is_callable = is_simple_callable(instance)
+        if is_callable:
+            instance = instance()
+        plan.append((attr, is_callable))
+    return tuple(plan), instance
+
+
+def _fast_get_attribute(field):
+    """Replace field.get_attribute with one that reuses the attribute path learned on the first row"""
+    slow_get_attribute = field.get_attribute
+    attrs = field.source_attrs
+    plan = None
+    
+    def get_attribute(instance):
+        nonlocal plan
+        if plan is None:
+            try:
+                plan, value = _attribute_plan(instance, attrs)
+            except Exception:
+                return slow_get_attribute(instance)
+            return value
+        
+        value = instance
+        try:
+            for attr, is_callable in plan:
+                value = getattr(value, attr)
+                if is_callable:
+                    value = value()
+        except (AttributeError, ObjectDoesNotExist):
+            # Missing relations and None hops keep DRF's default/required handling
+            return slow_get_attribute(instance)
+        return value
+    
+    field.get_attribute = get_attribute
+
+
+def _speed_up_fields(serializer):
+    """Install the fast attribute lookup on the readable fields of serializer and its nested serializers"""
+    for field in serializer._readable_fields:
+        if field.source_attrs and 'get_attribute' not in vars(field):
+            _fast_get_attribute(field)
+        if isinstance(field, serializers.Serializer):
+            _speed_up_fields(field)
 
-class DepartmentBasicSerializer(serializers.ModelSerializer):
+
+class SparseFieldsMixin:
+    """Render only the fields named in ?fields=a,b; skipped method fields are never computed"""
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        # Only the top-level serializer (or the child of a top-level list) is pruned
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        request = self.context.get('request')
+        if parent is not None or request is None:
+            return fields
+        
+        requested = request.query_params.get('fields')
+        if not requested:
+            return fields
+        requested = {name.strip() for name in requested.split(',')}
+        return {name: field for name, field in fields.items() if name in requested}
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """ListSerializer that skips the per-row is_simple_callable checks after the first row"""
+    
+    def to_representation(self, data):
+        _speed_up_fields(self.child)
+        return super().to_representation(data)
+
+
+class DepartmentBasicSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Basic department information serializer"""
     
     institute_name = serializers.CharField(source='institute.name', read_only=True)
@@ -28,9 +178,17 @@ class DepartmentBasicSerializer(serializers.ModelSerializer):
             'id', 'name', 'code', 'institute', 'institute_name',
             'department_type', 'head_of_department', 'is_active'
         ]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the institute and load only the columns rendered"""
+        return queryset.select_related('institute').only(
+            'id', 'name', 'code', 'institute__name',
+            'department_type', 'head_of_department', 'is_active'
+        )
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Complete department serializer"""
     
     institute_name = serializers.CharField(source='institute.name', read_only=True)
@@ -50,17 +208,29 @@ class DepartmentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Annotate the active student, course and faculty counts in the list query"""
+        return queryset.select_related('institute').annotate(
+            total_students_count=_active_count(Student),
+            total_courses_count=_active_count(Course),
+            total_faculty_count=_active_count(Faculty),
+        )
+    
     def get_total_students(self, obj):
-        return obj.students.filter(is_active=True).count()
+        count = getattr(obj, 'total_students_count', None)
+        return count if count is not None else obj.students.filter(is_active=True).count()
     
     def get_total_courses(self, obj):
-        return obj.courses.filter(is_active=True).count()
+        count = getattr(obj, 'total_courses_count', None)
+        return count if count is not None else obj.courses.filter(is_active=True).count()
     
     def get_total_faculty(self, obj):
-        return obj.faculty.filter(is_active=True).count()
+        count = getattr(obj, 'total_faculty_count', None)
+        return count if count is not None else obj.faculty.filter(is_active=True).count()
 
 
-class DepartmentDetailSerializer(DepartmentSerializer):
+class DepartmentDetailSerializer(SparseFieldsMixin, DepartmentSerializer):
     """Detailed department serializer with related data"""
     
     courses = serializers.SerializerMethodField()
@@ -72,45 +242,106 @@ class DepartmentDetailSerializer(DepartmentSerializer):
             'courses', 'recent_applications', 'admin_users'
         ]
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Counts plus the active courses of every department, prefetched in one query"""
+        return super().setup_eager_loading(queryset).prefetch_related(
+            Prefetch('courses', queryset=Course.objects.filter(is_active=True), to_attr='active_courses')
+        )
+    
+    def _recent_applications_by_department(self):
+        """Latest applications of every department being serialized, from one windowed query"""
+        if 'recent_by_dept' not in self.context:
+            if isinstance(self.parent, serializers.ListSerializer):
+                departments = self.parent.instance
+            else:
+                departments = [self.instance]
+            
+            recent_apps = ScholarshipApplication.objects.filter(
+                student__department__in=[department.pk for department in departments]
+            ).annotate(
+                row_number=Window(
+                    RowNumber(),
+                    partition_by=[F('student__department_id')],
+                    order_by=F('submitted_at').desc()
+                )
+            ).filter(
+                row_number__lte=DETAIL_RECENT_APPLICATIONS_LIMIT
+            ).order_by('-submitted_at').values(
+                'application_id', 'scholarship_type', 'amount_requested', 'status', 'submitted_at',
+                'student__department_id', 'student__user__first_name', 'student__user__last_name'
+            )
+            
+            recent_by_dept = {}
+            for app in recent_apps:
+                recent_by_dept.setdefault(app['student__department_id'], []).append({
+                    'application_id': app['application_id'],
+                    'student_name': _full_name(app['student__user__first_name'], app['student__user__last_name']),
+                    'scholarship_type': app['scholarship_type'],
+                    'amount_requested': app['amount_requested'],
+                    'status': app['status'],
+                    'submitted_at': app['submitted_at']
+                })
+            self.context['recent_by_dept'] = recent_by_dept
+        return self.context['recent_by_dept']
+    
     def get_courses(self, obj):
-        courses = obj.courses.filter(is_active=True)[:5]
+        courses = getattr(obj, 'active_courses', None)
+        if courses is None:
+            return list(obj.courses.filter(is_active=True).values(
+                'id', 'name', 'code', 'course_type', 'total_seats'
+            )[:DETAIL_COURSES_LIMIT])
         return [{
             'id': course.id,
             'name': course.name,
             'code': course.code,
             'course_type': course.course_type,
             'total_seats': course.total_seats
-        } for course in courses]
+        } for course in courses[:DETAIL_COURSES_LIMIT]]
     
     def get_recent_applications(self, obj):
-        recent_apps = ScholarshipApplication.objects.filter(
-            student__department=obj
-        ).select_related('student', 'student__user').order_by('-submitted_at')[:5]
-        
-        return [{
-            'application_id': app.application_id,
-            'student_name': app.student.user.get_full_name(),
-            'scholarship_type': app.scholarship_type,
-            'amount_requested': app.amount_requested,
-            'status': app.status,
-            'submitted_at': app.submitted_at
-        } for app in recent_apps]
+        return self._recent_applications_by_department().get(obj.pk, [])
     
     def get_admin_users(self, obj):
-        admins = obj.admins.filter(user__is_active=True)
+        admins = obj.admins.filter(user__is_active=True).values(
+            'id', 'user__first_name', 'user__last_name', 'user__email',
+            'designation', 'is_primary_admin'
+        )
         return [{
-            'id': admin.id,
-            'user_name': admin.user.get_full_name(),
-            'user_email': admin.user.email,
-            'designation': admin.designation,
-            'is_primary_admin': admin.is_primary_admin
+            'id': admin['id'],
+            'user_name': _full_name(admin['user__first_name'], admin['user__last_name']),
+            'user_email': admin['user__email'],
+            'designation': admin['designation'],
+            'is_primary_admin': admin['is_primary_admin']
         } for admin in admins]
 
 
-class DepartmentAdminSerializer(serializers.ModelSerializer):
+class UserDetailsSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Contact details of the user behind a department admin"""
+    
+    full_name = serializers.CharField(source='get_full_name', read_only=True)
+    
+    class Meta:
+        model = CustomUser
+        fields = [
+            'id', 'email', 'first_name', 'last_name', 'full_name',
+            'phone_number', 'is_active'
+        ]
+        read_only_fields = fields
+
+
+class FacultyUserDetailsSerializer(UserDetailsSerializer):
+    """Contact details of the user behind a faculty member"""
+    
+    class Meta(UserDetailsSerializer.Meta):
+        fields = ['email', 'first_name', 'last_name', 'full_name', 'phone_number']
+        read_only_fields = fields
+
+
+class DepartmentAdminSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Department admin serializer"""
     
-    user_details = serializers.SerializerMethodField()
+    user_details = UserDetailsSerializer(source='user', read_only=True)
     department_name = serializers.CharField(source='department.name', read_only=True)
     
     class Meta:
@@ -122,19 +353,13 @@ class DepartmentAdminSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
     
-    def get_user_details(self, obj):
-        return {
-            'id': obj.user.id,
-            'email': obj.user.email,
-            'first_name': obj.user.first_name,
-            'last_name': obj.user.last_name,
-            'full_name': obj.user.get_full_name(),
-            'phone_number': obj.user.phone_number,
-            'is_active': obj.user.is_active
-        }
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the user and department rendered for each admin"""
+        return queryset.select_related('user', 'department')
 
 
-class StudentBasicInfoSerializer(serializers.ModelSerializer):
+class StudentBasicInfoSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Basic student information for application lists"""
     
     user_name = serializers.CharField(source='user.get_full_name', read_only=True)
@@ -148,9 +373,14 @@ class StudentBasicInfoSerializer(serializers.ModelSerializer):
             'course_level', 'course_name', 'academic_year', 'cgpa',
             'is_active', 'is_verified', 'enrollment_date'
         ]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the user and institute rendered for each student"""
+        return queryset.select_related('user', 'institute')
 
 
-class VerifiedApplicationListSerializer(serializers.ModelSerializer):
+class VerifiedApplicationListSerializer(SparseFieldsMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for listing verified applications for department review"""
     
     student_details = StudentBasicInfoSerializer(source='student', read_only=True)
@@ -170,56 +400,65 @@ class VerifiedApplicationListSerializer(serializers.ModelSerializer):
             'days_since_institute_approval', 'is_forwarded_to_finance',
             'processing_priority', 'eligibility_score', 'document_completeness_score'
         ]
+        list_serializer_class = FastListSerializer
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the student, user and institute, loading only the columns rendered"""
+        return queryset.select_related('student__user', 'student__institute').only(
+            'id', 'application_id', 'scholarship_type', 'scholarship_name',
+            'amount_requested', 'amount_approved', 'status', 'priority', 'reason',
+            'submitted_at', 'approved_at', 'dept_review_state',
+            'eligibility_score', 'document_completeness_score',
+            'student__student_id', 'student__course_level', 'student__course_name',
+            'student__academic_year', 'student__cgpa', 'student__is_active',
+            'student__is_verified', 'student__enrollment_date',
+            'student__user__first_name', 'student__user__last_name', 'student__user__email',
+            'student__institute__name'
+        )
+    
+    def _now(self):
+        """One timestamp per serialization pass, shared by every row"""
+        if '_now' not in self.context:
+            self.context['_now'] = timezone.now()
+        return self.context['_now']
     
     def get_department_status(self, obj):
         """Determine department processing status"""
-        if obj.internal_notes:
-            if 'DEPT_APPROVED' in obj.internal_notes:
-                if 'FORWARDED_TO_FINANCE' in obj.internal_notes:
-                    return 'forwarded_to_finance'
-                return 'dept_approved'
-            elif 'DEPT_REJECTED' in obj.internal_notes:
-                return 'dept_rejected'
-        return 'pending_review'
+        return DEPT_STATUS_LABELS.get(obj.dept_review_state, 'pending_review')
     
     def get_days_since_institute_approval(self, obj):
         """Calculate days since institute approval"""
         if obj.approved_at:
-            return (timezone.now() - obj.approved_at).days
+            return (self._now() - obj.approved_at).days
         return 0
     
     def get_is_forwarded_to_finance(self, obj):
         """Check if application is forwarded to finance"""
-        return obj.internal_notes and 'FORWARDED_TO_FINANCE' in obj.internal_notes
+        return obj.dept_review_state == 'forwarded'
     
     def get_processing_priority(self, obj):
         """Determine processing priority based on various factors"""
-        priority_score = 0
+        # Annotated by the list view through processing_priority_label()
+        label = getattr(obj, 'processing_priority_label', None)
+        if label is not None:
+            return label
         
-        # Base priority
-        priority_map = {'urgent': 4, 'high': 3, 'medium': 2, 'low': 1}
-        priority_score += priority_map.get(obj.priority, 2)
+        priority_score = PRIORITY_SCORES.get(obj.priority, DEFAULT_PRIORITY_SCORE)
         
         # Days since approval
         if obj.approved_at:
-            days_since = (timezone.now() - obj.approved_at).days
-            if days_since > 7:
-                priority_score += 2
-            elif days_since > 3:
-                priority_score += 1
+            days_since = (self._now() - obj.approved_at).days
+            priority_score += next((bump for days, bump in APPROVAL_AGE_BUMPS if days_since > days), 0)
         
         # Amount factor
-        if obj.amount_approved and obj.amount_approved > 75000:
+        if obj.amount_approved and obj.amount_approved > LARGE_AMOUNT_THRESHOLD:
             priority_score += 1
         
-        if priority_score >= 6:
-            return 'urgent'
-        elif priority_score >= 4:
-            return 'high'
-        elif priority_score >= 2:
-            return 'medium'
-        else:
-            return 'low'
+        return next(
+            (label for minimum, label in PROCESSING_PRIORITY_THRESHOLDS if priority_score >= minimum),
+            'low'
+        )
 
 
 class ApplicationReviewSerializer(serializers.Serializer):
@@ -278,7 +517,7 @@ class ApplicationForwardSerializer(serializers.Serializer):
         return value
 
 
-class ApplicationDecisionSerializer(serializers.ModelSerializer):
+class ApplicationDecisionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for application decision response"""
     
     student_name = serializers.CharField(source='student.user.get_full_name', read_only=True)
@@ -295,11 +534,11 @@ class ApplicationDecisionSerializer(serializers.ModelSerializer):
     
     def get_department_status(self, obj):
         """Get department processing status"""
-        if obj.internal_notes:
-            if 'DEPT_APPROVED' in obj.internal_notes:
-                return 'dept_approved'
-            elif 'DEPT_REJECTED' in obj.internal_notes:
-                return 'dept_rejected'
+        # After a review save internal_notes holds the AppendNote expression, not text
+        if obj.dept_review_state in ('approved', 'forwarded'):
+            return 'dept_approved'
+        elif obj.dept_review_state == 'rejected':
+            return 'dept_rejected'
         return 'pending_review'
 
 
@@ -374,7 +613,7 @@ class DepartmentReportSerializer(serializers.Serializer):
     forwarded_applications = serializers.ListField(child=ForwardedApplicationTrackingSerializer(), required=False)
 
 
-class DepartmentStatisticsSerializer(serializers.Serializer):
+class DepartmentStatisticsSerializer(SparseFieldsMixin, serializers.Serializer):
     """Serializer for department statistics"""
     
     # Student statistics
@@ -402,7 +641,7 @@ class DepartmentStatisticsSerializer(serializers.Serializer):
     processing_efficiency = serializers.DecimalField(max_digits=5, decimal_places=2)
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Course serializer for department"""
     
     department_name = serializers.CharField(source='department.name', read_only=True)
@@ -417,14 +656,30 @@ class CourseSerializer(serializers.ModelSerializer):
             'eligibility_criteria', 'is_active', 'total_students'
         ]
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Annotate each course's active student count in the list query"""
+        # Students name their course as free text, hence the containment match
+        students = Student.objects.filter(
+            department=OuterRef('department_id'),
+            course_name__icontains=OuterRef('name'),
+            is_active=True
+        ).order_by().values('department').annotate(count=Count('pk')).values('count')
+        return queryset.select_related('department').annotate(
+            total_students_count=Coalesce(Subquery(students, output_field=IntegerField()), 0)
+        )
+    
     def get_total_students(self, obj):
+        count = getattr(obj, 'total_students_count', None)
+        if count is not None:
+            return count
         return obj.department.students.filter(
             course_name__icontains=obj.name,
             is_active=True
         ).count()
 
 
-class SubjectSerializer(serializers.ModelSerializer):
+class SubjectSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Subject serializer for courses"""
     
     course_name = serializers.CharField(source='course.name', read_only=True)
@@ -438,10 +693,10 @@ class SubjectSerializer(serializers.ModelSerializer):
         ]
 
 
-class FacultySerializer(serializers.ModelSerializer):
+class FacultySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Faculty serializer for department"""
     
-    user_details = serializers.SerializerMethodField()
+    user_details = FacultyUserDetailsSerializer(source='user', read_only=True)
     department_name = serializers.CharField(source='department.name', read_only=True)
     
     class Meta:
@@ -453,14 +708,10 @@ class FacultySerializer(serializers.ModelSerializer):
             'office_hours', 'research_interests', 'is_active'
         ]
     
-    def get_user_details(self, obj):
-        return {
-            'email': obj.user.email,
-            'first_name': obj.user.first_name,
-            'last_name': obj.user.last_name,
-            'full_name': obj.user.get_full_name(),
-            'phone_number': obj.user.phone_number
-        }
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the user and department rendered for each faculty member"""
+        return queryset.select_related('user', 'department')
 
 
 class ApplicationWorkflowSerializer(serializers.Serializer):
@@ -484,6 +735,25 @@ class BulkActionResponseSerializer(serializers.Serializer):
 
 
 # Utility Serializers
+@lru_cache(maxsize=1)
+def _build_choices():
+    """Choice lists built once per process from the model constants; read-only, shared by every caller"""
+    return MappingProxyType({
+        'scholarship_types': tuple(
+            MappingProxyType({'value': choice[0], 'label': choice[1]})
+            for choice in ScholarshipApplication.SCHOLARSHIP_TYPES
+        ),
+        'priority_levels': tuple(
+            MappingProxyType({'value': choice[0], 'label': choice[1]})
+            for choice in ScholarshipApplication.PRIORITY_LEVELS
+        ),
+        'course_types': tuple(
+            MappingProxyType({'value': choice[0], 'label': choice[1]})
+            for choice in Course.COURSE_TYPES
+        )
+    })
+
+
 class DepartmentChoicesSerializer(serializers.Serializer):
     """Serializer for department-related choices"""
     
@@ -492,21 +762,10 @@ class DepartmentChoicesSerializer(serializers.Serializer):
     course_types = serializers.ListField(child=serializers.DictField(), read_only=True)
     
     def to_representation(self, instance):
-        from students.models import ScholarshipApplication
-        
+        # Plain copies for the renderer and caller; the cached lists stay untouched
         return {
-            'scholarship_types': [
-                {'value': choice[0], 'label': choice[1]}
-                for choice in ScholarshipApplication.SCHOLARSHIP_TYPES
-            ],
-            'priority_levels': [
-                {'value': choice[0], 'label': choice[1]}
-                for choice in ScholarshipApplication.PRIORITY_LEVELS
-            ],
-            'course_types': [
-                {'value': choice[0], 'label': choice[1]}
-                for choice in Course.COURSE_TYPES
-            ]
+            key: [dict(choice) for choice in choices]
+            for key, choices in _build_choices().items()
         }
 
 
@@ -13,6 +13,51 @@ from .models import Department, DepartmentAdmin
 from students.models import ScholarshipApplication
 
 
+# Application statuses meaning the institute approved it (as in the department views)
+INSTITUTE_APPROVED_STATUSES = ('approved', 'partially_approved')
+
+# Cached on the request when the user has no DepartmentAdmin profile
+_NO_DEPT_ADMIN = object()
+
+
+def _get_dept_admin(request):
+    """The requesting user's DepartmentAdmin, fetched once per request; None if there is none"""
+    if not request.user or not request.user.is_authenticated:
+        return None
+    
+    dept_admin = getattr(request, '_cached_dept_admin', None)
+    if dept_admin is None:
+        try:
+            dept_admin = DepartmentAdmin.objects.select_related(
+                'department', 'department__institute'
+            ).get(user=request.user)
+        except DepartmentAdmin.DoesNotExist:
+            dept_admin = _NO_DEPT_ADMIN
+        request._cached_dept_admin = dept_admin
+    
+    if dept_admin is _NO_DEPT_ADMIN:
+        return None
+    # Views read the profile from here (see department_api_views.get_department)
+    request.dept_admin = dept_admin
+    return dept_admin
+
+
+def _get_perms_dict(dept_admin):
+    """dept_admin.permissions as a dict, parsed once per DepartmentAdmin instance"""
+    perms = getattr(dept_admin, '_perms_dict', None)
+    if perms is None:
+        perms = dept_admin.permissions
+        # Older rows may hold the permissions as a JSON-encoded string
+        if isinstance(perms, str):
+            try:
+                perms = json.loads(perms)
+            except (json.JSONDecodeError, TypeError):
+                perms = {}
+        perms = perms or {}
+        dept_admin._perms_dict = perms
+    return perms
+
+
 class IsDepartmentAdminAuthenticated(BasePermission):
     """
     Custom permission to only allow access to department administrators.
@@ -22,16 +67,7 @@ class IsDepartmentAdminAuthenticated(BasePermission):
         """
         Check if user is authenticated and is a department admin.
         """
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        try:
-            dept_admin = DepartmentAdmin.objects.get(user=request.user)
-            # Add department admin to request for later use
-            request.dept_admin = dept_admin
-            return True
-        except DepartmentAdmin.DoesNotExist:
-            return False
+        return _get_dept_admin(request) is not None
 
 
 class DepartmentAdminBasePermission(BasePermission):
@@ -41,258 +77,146 @@ class DepartmentAdminBasePermission(BasePermission):
     
     def has_permission(self, request, view):
         """Base permission check"""
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        try:
-            dept_admin = DepartmentAdmin.objects.select_related('department').get(
-                user=request.user
-            )
-            request.dept_admin = dept_admin
-            return True
-        except DepartmentAdmin.DoesNotExist:
-            return False
+        return _get_dept_admin(request) is not None
     
     def get_department_admin(self, request):
         """Get department admin from request"""
         return getattr(request, 'dept_admin', None)
 
 
-class CanReviewApplicationsPermission(DepartmentAdminBasePermission):
-    """
-    Permission to review scholarship applications
-    """
-    
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
-        
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        # Check if user has review permissions
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        return permissions.get('can_review_applications', True)
-    
-    def has_object_permission(self, request, view, obj):
-        """Check if admin can review specific application"""
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        # Ensure application belongs to admin's department
-        if hasattr(obj, 'student'):
-            return obj.student.department == dept_admin.department
-        
-        return False
+def _application_action_key(request):
+    """Permission key for the review action in the request: approve, reject or plain review"""
+    if request.method in ['POST', 'PUT', 'PATCH']:
+        action = request.data.get('action', '').lower()
+        if 'approve' in action:
+            return 'can_approve_applications'
+        elif 'reject' in action:
+            return 'can_reject_applications'
+    return 'can_review_applications'
 
 
-class CanApproveApplicationsPermission(DepartmentAdminBasePermission):
+class DepartmentPermission(DepartmentAdminBasePermission):
     """
-    Permission to approve/reject scholarship applications
+    Department admin permission configured by class attributes and checked in a
+    single pass over the request's cached admin profile and permissions
+    (build subclasses with make_department_permission)
     """
     
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
-        
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        # Check specific action permissions
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            action = request.data.get('action', '')
-            if 'approve' in action.lower():
-                return permissions.get('can_approve_applications', True)
-            elif 'reject' in action.lower():
-                return permissions.get('can_reject_applications', True)
-        
-        return permissions.get('can_review_applications', True)
-    
-    def has_object_permission(self, request, view, obj):
-        """Check if admin can approve/reject specific application"""
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        # Ensure application belongs to admin's department
-        if hasattr(obj, 'student'):
-            return obj.student.department == dept_admin.department
-        
-        return False
-
-
-class CanForwardToFinancePermission(DepartmentAdminBasePermission):
-    """
-    Permission to forward approved applications to finance
-    """
+    # Permission keys that must all be granted; missing keys fall back to default
+    required = ()
+    default = False
+    require_primary = False
+    # Also require the approve/reject/review key matching the request's action
+    application_action = False
+    # Object checks: application belongs to the admin's department, and is
+    # still open for department review on writes
+    same_department = False
+    status_check = False
     
     def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
-        
-        dept_admin = self.get_department_admin(request)
+        dept_admin = _get_dept_admin(request)
         if not dept_admin:
             return False
         
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        return permissions.get('can_forward_to_finance', True)
-
-
-class CanGenerateReportsPermission(DepartmentAdminBasePermission):
-    """
-    Permission to generate department reports and access dashboard
-    """
-    
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
-        
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        return permissions.get('can_generate_reports', True)
-
-
-class CanManageStudentsPermission(DepartmentAdminBasePermission):
-    """
-    Permission to manage students in the department
-    """
-    
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
+        if self.require_primary and not dept_admin.is_primary_admin:
             return False
         
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
+        permissions = _get_perms_dict(dept_admin)
+        if not all(permissions.get(key, self.default) for key in self.required):
             return False
         
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        return permissions.get('can_manage_students', False)
-
-
-class CanManageCoursesPermission(DepartmentAdminBasePermission):
-    """
-    Permission to manage courses and subjects
-    """
+        if self.application_action:
+            return permissions.get(_application_action_key(request), True)
+        return True
     
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
+    def has_object_permission(self, request, view, obj):
+        if not (self.same_department or self.status_check):
+            return True
         
         dept_admin = self.get_department_admin(request)
         if not dept_admin:
             return False
         
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        return permissions.get('can_manage_courses', False)
-
-
-class CanManageFacultyPermission(DepartmentAdminBasePermission):
-    """
-    Permission to manage faculty members
-    """
-    
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
+        if self.status_check and not isinstance(obj, ScholarshipApplication):
             return False
         
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        return permissions.get('can_manage_faculty', False)
-
-
-class CanManageDepartmentSettingsPermission(DepartmentAdminBasePermission):
-    """
-    Permission to manage department settings and configurations
-    """
-    
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
-        
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        # Only primary admins can manage department settings
-        if not dept_admin.is_primary_admin:
+        # Ensure application belongs to admin's department
+        if not hasattr(obj, 'student') or obj.student.department_id != dept_admin.department_id:
             return False
         
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
+        # Check if application is in correct status for department review
+        if self.status_check and request.method in ['POST', 'PUT', 'PATCH']:
+            # Application must be institute-approved to be reviewed by department
+            if obj.status not in INSTITUTE_APPROVED_STATUSES:
+                return False
+            
+            # Already processed, no further changes allowed unless primary admin
+            if obj.dept_review_state != 'pending':
+                return dept_admin.is_primary_admin
         
-        return permissions.get('can_manage_department_settings', False)
+        return True
 
 
-class IsPrimaryDepartmentAdmin(DepartmentAdminBasePermission):
-    """
-    Permission for primary department administrators only
-    """
-    
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
-        
-        dept_admin = self.get_department_admin(request)
-        if not dept_admin:
-            return False
-        
-        return dept_admin.is_primary_admin
+def make_department_permission(name, required=(), default=False, require_primary=False,
+                               application_action=False, same_department=False, status_check=False):
+    """Build a named DepartmentPermission subclass checking all the given flags at once"""
+    return type(name, (DepartmentPermission,), {
+        '__module__': __name__,
+        'required': tuple(required),
+        'default': default,
+        'require_primary': require_primary,
+        'application_action': application_action,
+        'same_department': same_department,
+        'status_check': status_check,
+    })
+
+
+# Review scholarship applications of the admin's department
+CanReviewApplicationsPermission = make_department_permission(
+    'CanReviewApplicationsPermission',
+    required=('can_review_applications',), default=True, same_department=True
+)
+
+# Approve/reject scholarship applications, by the action in the request
+CanApproveApplicationsPermission = make_department_permission(
+    'CanApproveApplicationsPermission', application_action=True, same_department=True
+)
+
+# Forward approved applications to finance
+CanForwardToFinancePermission = make_department_permission(
+    'CanForwardToFinancePermission', required=('can_forward_to_finance',), default=True
+)
+
+# Generate department reports and access dashboard
+CanGenerateReportsPermission = make_department_permission(
+    'CanGenerateReportsPermission', required=('can_generate_reports',), default=True
+)
+
+# Manage students in the department
+CanManageStudentsPermission = make_department_permission(
+    'CanManageStudentsPermission', required=('can_manage_students',)
+)
+
+# Manage courses and subjects
+CanManageCoursesPermission = make_department_permission(
+    'CanManageCoursesPermission', required=('can_manage_courses',)
+)
+
+# Manage faculty members
+CanManageFacultyPermission = make_department_permission(
+    'CanManageFacultyPermission', required=('can_manage_faculty',)
+)
+
+# Department settings; only primary admins can manage them
+CanManageDepartmentSettingsPermission = make_department_permission(
+    'CanManageDepartmentSettingsPermission',
+    required=('can_manage_department_settings',), require_primary=True
+)
+
+# Primary department administrators only
+IsPrimaryDepartmentAdmin = make_department_permission(
+    'IsPrimaryDepartmentAdmin', require_primary=True
+)
 
 
 class DepartmentDataAccessPermission(DepartmentAdminBasePermission):
@@ -321,52 +245,13 @@ class DepartmentDataAccessPermission(DepartmentAdminBasePermission):
         return False
 
 
-class ApplicationStatusPermission(BasePermission):
-    """
-    Permission based on application status and department workflow
-    """
-    
-    def has_permission(self, request, view):
-        """Basic authentication check"""
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        try:
-            dept_admin = DepartmentAdmin.objects.get(user=request.user)
-            request.dept_admin = dept_admin
-            return True
-        except DepartmentAdmin.DoesNotExist:
-            return False
-    
-    def has_object_permission(self, request, view, obj):
-        """Check permissions based on application status"""
-        if not isinstance(obj, ScholarshipApplication):
-            return False
-        
-        dept_admin = getattr(request, 'dept_admin', None)
-        if not dept_admin:
-            return False
-        
-        # Ensure application belongs to admin's department
-        if obj.student.department != dept_admin.department:
-            return False
-        
-        # Check if application is in correct status for department review
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            # Application must be institute-approved to be reviewed by department
-            if obj.status != 'institute_approved':
-                return False
-            
-            # Check if application is already processed by department
-            if obj.internal_notes:
-                if any(status in obj.internal_notes for status in ['DEPT_APPROVED', 'DEPT_REJECTED']):
-                    # Already processed, no further changes allowed unless primary admin
-                    return dept_admin.is_primary_admin
-        
-        return True
+# Application status and department workflow
+ApplicationStatusPermission = make_department_permission(
+    'ApplicationStatusPermission', status_check=True
+)
 
 
-class DepartmentOperationPermission(BasePermission):
+class DepartmentOperationPermission(DepartmentPermission):
     """
     Combined permission class for department operations
     """
@@ -376,51 +261,25 @@ class DepartmentOperationPermission(BasePermission):
         Initialize with required permissions list
         :param required_permissions: List of permission keys required
         """
-        self.required_permissions = required_permissions or []
-    
-    def has_permission(self, request, view):
-        """Check if user has required permissions"""
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        try:
-            dept_admin = DepartmentAdmin.objects.get(user=request.user)
-            request.dept_admin = dept_admin
-        except DepartmentAdmin.DoesNotExist:
-            return False
-        
-        # Parse permissions
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
-        
-        # Check all required permissions
-        for perm in self.required_permissions:
-            if not permissions.get(perm, False):
-                return False
-        
-        return True
+        self.required = tuple(required_permissions or ())
 
 
 # Permission Classes for Specific Views
+class DepartmentAdminPermission(DepartmentAdminBasePermission):
+    """Permission for department admin API views"""
+    pass
+
+
 class VerifiedApplicationsListPermission(CanReviewApplicationsPermission):
     """Permission for viewing verified applications list"""
     pass
 
 
-class ApplicationReviewPermission(CanApproveApplicationsPermission, ApplicationStatusPermission):
-    """Permission for reviewing applications (approve/reject)"""
-    
-    def has_permission(self, request, view):
-        return (CanApproveApplicationsPermission.has_permission(self, request, view) and
-                ApplicationStatusPermission.has_permission(self, request, view))
-    
-    def has_object_permission(self, request, view, obj):
-        return (CanApproveApplicationsPermission.has_object_permission(self, request, view, obj) and
-                ApplicationStatusPermission.has_object_permission(self, request, view, obj))
+# Reviewing applications (approve/reject): action permission plus the
+# application status workflow, in one check
+ApplicationReviewPermission = make_department_permission(
+    'ApplicationReviewPermission', application_action=True, same_department=True, status_check=True
+)
 
 
 class ForwardToFinancePermission(CanForwardToFinancePermission):
@@ -531,15 +390,10 @@ def check_department_permission(user, permission_key, department=None):
     try:
         dept_admin = DepartmentAdmin.objects.get(user=user)
         
-        if department and dept_admin.department != department:
+        if department and dept_admin.department_id != department.pk:
             return False
         
-        permissions = dept_admin.permissions
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
+        permissions = _get_perms_dict(dept_admin)
         
         return permissions.get(permission_key, False)
     
@@ -552,14 +406,8 @@ def get_user_department_permissions(user):
     Get all permissions for a department admin user
     """
     try:
-        dept_admin = DepartmentAdmin.objects.get(user=user)
-        permissions = dept_admin.permissions
-        
-        if isinstance(permissions, str):
-            try:
-                permissions = json.loads(permissions)
-            except (json.JSONDecodeError, TypeError):
-                permissions = {}
+        dept_admin = DepartmentAdmin.objects.select_related('department').get(user=user)
+        permissions = _get_perms_dict(dept_admin)
         
         return {
             'department': dept_admin.department.name,
@@ -0,0 +1,32 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from students.models import ScholarshipApplication, Student
+from .caching import bump_applications_version
+
+
+def _invalidate_department(application):
+    """Bump the department's cache version once the current transaction commits"""
+    student_id = application.student_id
+    
+    def bump():
+        department_id = Student.objects.filter(pk=student_id).values_list(
+            'department_id', flat=True
+        ).first()
+        if department_id is not None:
+            bump_applications_version(department_id)
+    
+    transaction.on_commit(bump)
+
+
+@receiver(post_save, sender=ScholarshipApplication)
+def application_saved(sender, instance, **kwargs):
+    """Invalidate cached department data after an application changes"""
+    _invalidate_department(instance)
+
+
+@receiver(post_delete, sender=ScholarshipApplication)
+def application_deleted(sender, instance, **kwargs):
+    """Invalidate cached department data after an application is deleted"""
+    _invalidate_department(instance)
@@ -0,0 +1,82 @@
+"""
+Background tasks for the departments app
+"""
+
+import logging
+
+import requests
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from authentication.models import CustomUser
+from .models import Department
+
+logger = logging.getLogger(__name__)
+
+FINANCE_API_TIMEOUT = (3, 5)  # (connect, read) seconds
+
+# One pooled session per worker process so finance notifications reuse
+# keep-alive connections instead of a fresh TCP/TLS handshake per call
+_finance_session = requests.Session()
+_finance_session.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+
+
+@shared_task
+def notify_finance_module(forwards):
+    """Notify the finance module API about forwarded applications.
+    
+    `forwards` maps application_id to the FORWARDED_TO_FINANCE note entry.
+    """
+    finance_api_url = getattr(settings, 'FINANCE_MODULE_API_URL', None)
+    for application_id, finance_forward in forwards.items():
+        try:
+            logger.info(f"Finance notification: Application {application_id} forwarded for disbursement")
+            
+            if finance_api_url:
+                response = _finance_session.post(
+                    f"{finance_api_url}/notifications/",
+                    json=finance_forward,
+                    timeout=FINANCE_API_TIMEOUT
+                )
+                response.raise_for_status()
+            
+        except Exception as e:
+            logger.warning(f"Failed to notify finance module: {str(e)}")
+
+
+@shared_task(autoretry_for=(Exception,), retry_kwargs={'max_retries': 3, 'countdown': 60})
+def send_finance_email(department_id, count, user_id):
+    """Email the finance team that a department forwarded applications"""
+    finance_emails = getattr(settings, 'FINANCE_TEAM_EMAILS', [])
+    if not finance_emails:
+        return
+    
+    department = Department.objects.only('name').get(pk=department_id)
+    user = CustomUser.objects.only('first_name', 'last_name', 'email').get(pk=user_id)
+    
+    subject = f"New Applications Forwarded from {department.name}"
+    message = f"""
+    Dear Finance Team,
+    
+    {count} scholarship applications have been forwarded from {department.name} department 
+    for disbursement processing.
+    
+    Forwarded by: {user.get_full_name()} ({user.email})
+    Department: {department.name}
+    Date: {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}
+    
+    Please log into the finance portal to review and process these applications.
+    
+    Best regards,
+    Scholarship Portal System
+    """
+    
+    send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, finance_emails)
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from authentication.models import CustomUser
+from students.models import Student
+from departments.department_serializers import FastListSerializer
+
+
+class RowSerializer(serializers.Serializer):
+    """Covers a plain attribute, a callable source and relation hops that can be None"""
+    
+    application_id = serializers.CharField()
+    student_name = serializers.CharField(source='student.user.get_full_name', read_only=True)
+    institute_name = serializers.CharField(source='student.institute.name', read_only=True)
+    institute_code = serializers.CharField(source='student.institute.code', allow_null=True)
+
+
+def make_row(application_id, first_name, last_name, institute):
+    user = CustomUser(first_name=first_name, last_name=last_name)
+    return SimpleNamespace(
+        application_id=application_id,
+        student=SimpleNamespace(user=user, institute=institute)
+    )
+
+
+class FastListSerializerTests(SimpleTestCase):
+    """FastListSerializer must render exactly what a plain ListSerializer renders"""
+    
+    def assertSameAsListSerializer(self, rows):
+        expected = serializers.ListSerializer(child=RowSerializer(), instance=rows).data
+        actual = FastListSerializer(child=RowSerializer(), instance=rows).data
+        self.assertEqual(actual, expected)
+        return actual
+    
+    def test_plain_rows(self):
+        institute = SimpleNamespace(name='Government College', code='GC01')
+        rows = [
+            make_row('APP00000001', 'Asha', 'Rao', institute),
+            make_row('APP00000002', 'Ravi', 'Kumar', institute),
+        ]
+        data = self.assertSameAsListSerializer(rows)
+        self.assertEqual(data[1]['student_name'], 'Ravi Kumar')
+        self.assertEqual(data[1]['institute_code'], 'GC01')
+    
+    def test_none_hop_after_plan_is_learned(self):
+        institute = SimpleNamespace(name='Government College', code='GC01')
+        rows = [
+            make_row('APP00000001', 'Asha', 'Rao', institute),
+            make_row('APP00000002', 'Ravi', 'Kumar', None),
+        ]
+        data = self.assertSameAsListSerializer(rows)
+        self.assertNotIn('institute_name', data[1])
+        self.assertIsNone(data[1]['institute_code'])
+    
+    def test_first_row_fails_plan_learning(self):
+        institute = SimpleNamespace(name='Government College', code='GC01')
+        rows = [
+            make_row('APP00000001', 'Asha', 'Rao', None),
+            make_row('APP00000002', 'Ravi', 'Kumar', institute),
+            make_row('APP00000003', 'Meera', 'Iyer', None),
+        ]
+        data = self.assertSameAsListSerializer(rows)
+        self.assertEqual(data[1]['institute_name'], 'Government College')
+    
+    def test_missing_related_object(self):
+        # An unsaved Student without an institute raises RelatedObjectDoesNotExist
+        user = CustomUser(first_name='Asha', last_name='Rao')
+        rows = [
+            make_row('APP00000001', 'Ravi', 'Kumar', SimpleNamespace(name='Government College', code='GC01')),
+            SimpleNamespace(application_id='APP00000002', student=Student(user=user)),
+        ]
+        self.assertSameAsListSerializer(rows)
+    
+    def test_callable_source_is_called_per_row(self):
+        institute = SimpleNamespace(name='Government College', code='GC01')
+        rows = [make_row(f'APP0000000{i}', f'First{i}', 'Last', institute) for i in range(3)]
+        data = self.assertSameAsListSerializer(rows)
+        self.assertEqual([row['student_name'] for row in data], ['First0 Last', 'First1 Last', 'First2 Last'])
@@ -66,7 +66,7 @@ class PendingApplicationsListView(generics.ListAPIView):
         # Base queryset - applications forwarded to finance
         queryset = ScholarshipApplication.objects.filter(
             status__in=['institute_approved', 'dept_approved'],
-            internal_notes__icontains='FORWARDED_TO_FINANCE'
+            dept_review_state='forwarded'
         ).select_related(
             'student', 'student__user', 'student__institute', 'student__department'
         ).exclude(
@@ -1392,7 +1392,7 @@ class FinanceDashboardView(views.APIView):
         # Applications metrics
         total_applications = applications_qs.count()
         pending_finance = applications_qs.filter(
-            internal_notes__icontains='FORWARDED_TO_FINANCE',
+            dept_review_state='forwarded',
             status__in=['institute_approved', 'dept_approved']
         ).exclude(disbursement__isnull=False).count()
         
@@ -1548,7 +1548,7 @@ class FinanceDashboardView(views.APIView):
         # Warning alerts
         pending_count = ScholarshipApplication.objects.filter(
             **institute_filter,
-            internal_notes__icontains='FORWARDED_TO_FINANCE',
+            dept_review_state='forwarded',
             status__in=['institute_approved', 'dept_approved']
         ).exclude(disbursement__isnull=False).count()
         
@@ -57,7 +57,7 @@ class FinanceApplicationListSerializer(serializers.ModelSerializer):
     
     def get_days_in_finance_queue(self, obj):
         """Calculate days since forwarded to finance"""
-        if 'FORWARDED_TO_FINANCE' in (obj.internal_notes or ''):
+        if obj.dept_review_state == 'forwarded':
             # Try to extract forward date from internal notes
             # In real implementation, this would be tracked separately
             return (timezone.now() - obj.approved_at).days if obj.approved_at else 0
@@ -292,7 +292,7 @@ class BulkPaymentSerializer(serializers.Serializer):
         applications = ScholarshipApplication.objects.filter(
             application_id__in=value,
             status__in=['institute_approved', 'dept_approved'],
-            internal_notes__icontains='FORWARDED_TO_FINANCE'
+            dept_review_state='forwarded'
         ).exclude(disbursement__isnull=False)
         
         if applications.count() != len(value):
@@ -398,7 +398,7 @@ class DisbursementCreateSerializer(serializers.ModelSerializer):
         if value.status not in ['institute_approved', 'dept_approved']:
             raise serializers.ValidationError("Application not approved for disbursement")
         
-        if 'FORWARDED_TO_FINANCE' not in (value.internal_notes or ''):
+        if value.dept_review_state != 'forwarded':
             raise serializers.ValidationError("Application not forwarded to finance")
         
         return value
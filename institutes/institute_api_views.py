@@ -398,7 +398,7 @@ class ApplicationApprovalView(APIView):
             notes_data = []
         
         notes_data.append(log_data)
-        application.internal_notes = json.dumps(notes_data, indent=2)
+        application.internal_notes = json.dumps(notes_data, separators=(',', ':'))
 
 
 class ApplicationTrackingView(generics.RetrieveAPIView):
@@ -1026,7 +1026,7 @@ class ApplicationCommentsView(APIView):
                 notes_data = []
             
             notes_data.append(comment_data)
-            application.internal_notes = json.dumps(notes_data, indent=2)
+            application.internal_notes = json.dumps(notes_data, separators=(',', ':'))
             application.save()
             
             return Response(
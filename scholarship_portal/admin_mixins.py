@@ -0,0 +1,14 @@
+"""
+Shared Django admin mixins
+"""
+
+
+class ListDisplayOnlyMixin:
+    """Load only the list_display columns on the changelist; change forms still get full rows"""
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name and match.url_name.endswith('_changelist'):
+            queryset = queryset.only(*self.list_display)
+        return queryset
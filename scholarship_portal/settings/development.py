@@ -54,7 +54,7 @@ INSTALLED_APPS += [
 
 # Enhanced REST Framework settings for development
 REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
-    'rest_framework.renderers.JSONRenderer',
+    'scholarship_portal.renderers.ORJSONRenderer',
     'rest_framework.renderers.BrowsableAPIRenderer',  # API browsing in development
 ]
 
@@ -89,9 +89,18 @@ LOGGING['loggers']['django.db.backends'] = {
     'propagate': False,
 }
 
-# Cache configuration for development (dummy cache)
+# Run Celery tasks inline so development works without a worker
+CELERY_TASK_ALWAYS_EAGER = True
+
+# Cache configuration for development. The default cache holds the refresh
+# token blacklist and the password reset token digests, so it must actually
+# store entries (with DummyCache logged-out tokens keep working and every
+# reset link is rejected); dashboards stay uncached.
 CACHES = {
     'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'dashboards': {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
     }
 }
@@ -105,6 +105,21 @@ CACHES = {
         },
         'KEY_PREFIX': 'scholarship_portal',
         'TIMEOUT': 300,  # 5 minutes default
+    },
+    # Department dashboard and list summary payloads (plain primitives only)
+    'dashboards': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': config('REDIS_URL', default='redis://localhost:6379/1'),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': 50,
+                'retry_on_timeout': True,
+            },
+            'SERIALIZER': 'django_redis.serializers.msgpack.MSGPackSerializer',
+        },
+        'KEY_PREFIX': 'scholarship_portal',
+        'TIMEOUT': 300,
     }
 }
 
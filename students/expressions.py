@@ -0,0 +1,78 @@
+from django.db import NotSupportedError
+from django.db.models import F, FloatField, Func, JSONField, TextField, Value
+import json
+
+
+class AppendNote(Func):
+    """Append an entry to the JSON array kept in a notes text column, in SQL.
+    
+    Assign it to the field and save() (or pass it to update()/bulk_update()) so
+    the history is never loaded and re-serialized in Python. Normalizes like the
+    views used to: NULL/empty notes start a new array, a single JSON value is
+    wrapped by JSON_ARRAY_APPEND, and legacy plain text becomes {'old_notes': ...}.
+    Reload the instance to read the stored value back.
+    """
+    
+    output_field = TextField()
+    
+    def __init__(self, field_name, entry):
+        super().__init__(F(field_name), Value(json.dumps(entry, separators=(',', ':'))))
+    
+    def as_mysql(self, compiler, connection, **extra_context):
+        notes, notes_params = compiler.compile(self.source_expressions[0])
+        entry, entry_params = compiler.compile(self.source_expressions[1])
+        entry = f"CAST({entry} AS JSON)"
+        sql = (
+            f"CASE WHEN {notes} IS NULL OR {notes} = '' THEN JSON_ARRAY({entry}) "
+            f"WHEN JSON_VALID({notes}) THEN JSON_ARRAY_APPEND({notes}, '$', {entry}) "
+            f"ELSE JSON_ARRAY(JSON_OBJECT('old_notes', {notes}), {entry}) END"
+        )
+        params = (
+            notes_params * 2 + entry_params
+            + notes_params * 2 + entry_params
+            + notes_params + entry_params
+        )
+        return sql, params
+    
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError('AppendNote is only implemented for MySQL')
+
+
+class AsFloat(Func):
+    """Read a decimal column as a double, so rows come back as float, not Decimal.
+    
+    Adding a float literal promotes the value to DOUBLE on MySQL, which
+    Cast(..., FloatField()) doesn't (it adds the DECIMAL literal 0.0).
+    """
+    
+    template = '(%(expressions)s + 0e0)'
+    output_field = FloatField()
+
+
+class NoteForAction(Func):
+    """First entry of a notes JSON array whose "action" matches, extracted in SQL.
+    
+    Annotate with it to read one history entry (decoded to a dict) without
+    fetching and parsing the whole notes column. NULL when the notes are not
+    valid JSON or hold no entry for the action.
+    """
+    
+    output_field = JSONField()
+    
+    def __init__(self, field_name, action):
+        # JSON_SEARCH matches LIKE patterns, so keep underscores literal
+        super().__init__(F(field_name), Value(action.replace('_', '\\_')))
+    
+    def as_mysql(self, compiler, connection, **extra_context):
+        notes, notes_params = compiler.compile(self.source_expressions[0])
+        action, action_params = compiler.compile(self.source_expressions[1])
+        # JSON_SEARCH gives the path '$[n].action'; its '$[n]' prefix is the entry
+        sql = (
+            f"CASE WHEN JSON_VALID({notes}) THEN JSON_EXTRACT({notes}, SUBSTRING_INDEX(JSON_UNQUOTE("
+            f"JSON_SEARCH({notes}, 'one', {action}, NULL, '$[*].action')), '.', 1)) END"
+        )
+        params = notes_params * 3 + action_params
+        return sql, params
+    
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError('NoteForAction is only implemented for MySQL')
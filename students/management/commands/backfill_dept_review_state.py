@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from students.models import ScholarshipApplication
+
+
+class Command(BaseCommand):
+    help = 'Populate dept_review_state from the markers stored in internal_notes'
+
+    # Applied in order, so a later marker wins (a forwarded application also
+    # carries DEPT_APPROVED)
+    MARKERS = (
+        ('DEPT_REJECTED', 'rejected'),
+        ('DEPT_APPROVED', 'approved'),
+        ('FORWARDED_TO_FINANCE', 'forwarded'),
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Backfilling department review state...')
+        
+        with transaction.atomic():
+            for marker, state in self.MARKERS:
+                updated = ScholarshipApplication.objects.filter(
+                    internal_notes__contains=marker
+                ).update(dept_review_state=state)
+                self.stdout.write(f'  {state}: {updated} applications')
+            
+            # The decision time isn't recorded in a column for old rows; the last
+            # update is the closest match and is what the dashboard used to sort by
+            ScholarshipApplication.objects.exclude(dept_review_state='pending').filter(
+                dept_reviewed_at__isnull=True
+            ).update(dept_reviewed_at=F('updated_at'))
+        
+        self.stdout.write(self.style.SUCCESS('Department review state backfilled'))
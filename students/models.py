@@ -140,6 +140,10 @@ class Student(models.Model):
             models.Index(fields=['course_level', 'academic_year']),
             models.Index(fields=['enrollment_date']),
             models.Index(fields=['is_active', 'is_verified']),
+            # Department review lists only take verified students
+            models.Index(fields=['department', 'is_verified']),
+            # Active-student counts per department (department and course lists)
+            models.Index(fields=['department', 'is_active'], name='student_dept_active'),
         ]
         constraints = [
             models.CheckConstraint(
@@ -406,6 +410,13 @@ class ScholarshipApplication(models.Model):
         ('urgent', 'Urgent'),
     )
     
+    DEPT_REVIEW_STATES = (
+        ('pending', 'Pending'),
+        ('approved', 'Approved'),
+        ('rejected', 'Rejected'),
+        ('forwarded', 'Forwarded to Finance'),
+    )
+    
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='scholarship_applications')
     application_id = models.CharField(
         max_length=30, 
@@ -480,6 +491,14 @@ class ScholarshipApplication(models.Model):
     # Review details
     review_comments = models.TextField(blank=True, null=True)
     internal_notes = models.TextField(blank=True, null=True)
+    # Latest department decision, kept alongside the internal_notes history so
+    # department filters are an indexed equality instead of a LIKE over notes
+    # (indexed through app_state_student in Meta.indexes)
+    dept_review_state = models.CharField(
+        max_length=16, choices=DEPT_REVIEW_STATES, default='pending'
+    )
+    dept_reviewed_at = models.DateTimeField(blank=True, null=True)
+    dept_reviewer_email = models.EmailField(blank=True, null=True)
     rejection_reason = models.TextField(blank=True, null=True)
     
     # Compliance and eligibility
@@ -560,7 +579,16 @@ class ScholarshipApplication(models.Model):
             models.Index(fields=['status', 'priority']),
             models.Index(fields=['scholarship_type', 'academic_year']),
             models.Index(fields=['submitted_at', 'status']),
-            models.Index(fields=['student', 'status']),
+            # A student's applications by status, newest first; also serves
+            # the department list's student/status filter and -submitted_at order
+            models.Index(fields=['student', 'status', '-submitted_at'], name='app_dept_status_sub'),
+            models.Index(fields=['dept_review_state', 'student'], name='app_state_student'),
+            # Department reports: a department's students' applications in a
+            # submitted_at range
+            models.Index(fields=['student', 'submitted_at'], name='app_student_submitted'),
+            # Overdue department reviews: institute-approved, still pending,
+            # approved_at before a cutoff
+            models.Index(fields=['status', 'dept_review_state', 'approved_at'], name='app_status_state_appr'),
             models.Index(fields=['assigned_to', 'status']),
         ]
         constraints = [
@@ -0,0 +1,98 @@
+import json
+import unittest
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+
+from authentication.models import CustomUser
+from departments.models import Department
+from institutes.models import Institute
+from students.expressions import AppendNote, AsFloat, NoteForAction
+from students.models import ScholarshipApplication, Student
+
+
+@unittest.skipUnless(connection.vendor == 'mysql', 'The notes expressions are MySQL only')
+class NotesExpressionTests(TestCase):
+    """AppendNote and NoteForAction against the real MySQL JSON functions"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        institute = Institute.objects.create(
+            name='Government College', code='GC01', institute_type='college', established_year=1960,
+            address='Main Road', city='Pune', state='Maharashtra', postal_code='411001',
+            phone_number='0200000000', email='office@gc01.example.com'
+        )
+        department = Department.objects.create(name='Physics', code='PH', institute=institute)
+        user = CustomUser.objects.create_user(username='asha', email='asha@example.com', password='s3cret-pass')
+        student = Student.objects.create(
+            user=user, institute=institute, department=department, course_level='undergraduate',
+            course_name='BSc Physics', academic_year='2nd', enrollment_date=date(2023, 7, 1)
+        )
+        cls.application = ScholarshipApplication.objects.create(
+            student=student, scholarship_type='merit', scholarship_name='Merit Award',
+            amount_requested='25000.00', amount_approved='20000.50', reason='Merit'
+        )
+    
+    def set_notes(self, notes):
+        ScholarshipApplication.objects.filter(pk=self.application.pk).update(internal_notes=notes)
+    
+    def append(self, entry):
+        ScholarshipApplication.objects.filter(pk=self.application.pk).update(
+            internal_notes=AppendNote('internal_notes', entry)
+        )
+        self.application.refresh_from_db(fields=['internal_notes'])
+        return json.loads(self.application.internal_notes)
+    
+    def note_for(self, action):
+        return ScholarshipApplication.objects.annotate(
+            note=NoteForAction('internal_notes', action)
+        ).values_list('note', flat=True).get(pk=self.application.pk)
+    
+    def test_append_to_empty_notes(self):
+        for empty in (None, ''):
+            self.set_notes(empty)
+            self.assertEqual(self.append({'action': 'DEPT_APPROVED'}), [{'action': 'DEPT_APPROVED'}])
+    
+    def test_append_to_existing_array(self):
+        self.set_notes(json.dumps([{'action': 'SUBMITTED'}]))
+        self.assertEqual(
+            self.append({'action': 'DEPT_APPROVED', 'amount': 1.5}),
+            [{'action': 'SUBMITTED'}, {'action': 'DEPT_APPROVED', 'amount': 1.5}]
+        )
+    
+    def test_append_wraps_single_json_value(self):
+        self.set_notes(json.dumps({'action': 'SUBMITTED'}))
+        self.assertEqual(self.append({'action': 'DEPT_REJECTED'}), [{'action': 'SUBMITTED'}, {'action': 'DEPT_REJECTED'}])
+    
+    def test_append_keeps_legacy_plain_text(self):
+        self.set_notes('called the student')
+        self.assertEqual(
+            self.append({'action': 'DEPT_APPROVED'}),
+            [{'old_notes': 'called the student'}, {'action': 'DEPT_APPROVED'}]
+        )
+    
+    def test_note_for_action(self):
+        self.set_notes(json.dumps([
+            {'action': 'DEPT_APPROVED', 'by': 'first'},
+            {'action': 'FORWARDED_TO_FINANCE', 'by': 'second'},
+            {'action': 'DEPT_APPROVED', 'by': 'third'},
+        ]))
+        self.assertEqual(self.note_for('FORWARDED_TO_FINANCE'), {'action': 'FORWARDED_TO_FINANCE', 'by': 'second'})
+        self.assertEqual(self.note_for('DEPT_APPROVED'), {'action': 'DEPT_APPROVED', 'by': 'first'})
+    
+    def test_note_for_action_underscore_is_literal(self):
+        self.set_notes(json.dumps([{'action': 'DEPTXAPPROVED'}]))
+        self.assertIsNone(self.note_for('DEPT_APPROVED'))
+    
+    def test_note_for_action_on_invalid_or_missing_notes(self):
+        for notes in (None, 'called the student', json.dumps([{'action': 'SUBMITTED'}])):
+            self.set_notes(notes)
+            self.assertIsNone(self.note_for('DEPT_APPROVED'))
+    
+    def test_as_float(self):
+        amount = ScholarshipApplication.objects.annotate(
+            amount=AsFloat('amount_approved')
+        ).values_list('amount', flat=True).get(pk=self.application.pk)
+        self.assertIsInstance(amount, float)
+        self.assertEqual(amount, 20000.5)